@@ -25,50 +25,29 @@ at https://github.com/jjgomera
 from PyQt4 import QtCore, QtGui
 from H2Oprops_GUI import Ui_MainWindow
 from iapws97 import IAPWS97 as iapws
+from iapws97_array import StateTable
 import numpy as np
 from datetime import datetime
 
 
-def columnIdToPropertyValue(colid,water):
-    try:
-        if colid == 0:
-            value = water.P
-        elif colid == 1:
-            value = water.T
-        elif colid == 2:
-            value = water.rho
-        elif colid == 3:
-            value = water.x
-        elif colid == 4:
-            value = water.cp
-        elif colid == 5:
-            value = water.h
-        elif colid == 6:
-            value = water.s
-        elif colid == 7:
-            value = water.k
-        elif colid == 8:
-            value = water.alfa
-        elif colid == 9:
-            value = water.Prandt
-        elif colid == 10:
-            value = water.w
-        elif colid == 11:
-            value = water.nu
-        elif colid == 12:
-            value = water.mu
-        elif colid == 13:
-            value = water.alfav
-        else:
-            value = -1.0
-    except AttributeError:
-        value=-1.0
+#IAPWS97 property shown in each column of the table, the states are
+#created with props=columnProperties to calculate them all at once
+columnProperties = ("P", "T", "rho", "x", "cp", "h", "s", "k", "alfa",
+                    "Prandt", "w", "nu", "mu", "alfav")
+
+def columnIdToPropertyValue(colid,waterData,row):
+    """Value of the column colid for the state in row, nan for values not
+    available, as the cp of a two phases state, shown as blank cells"""
+    if 0 <= colid < len(columnProperties):
+        value = waterData[columnProperties[colid]][row]
+    else:
+        value = np.nan
             
     return value
 
 class WaterTableModel(QtCore.QAbstractTableModel):
     def __init__(self, parent=None, *args):
-        self.waterData = list()       
+        self.waterData = StateTable(columnProperties)
         super(WaterTableModel,self).__init__(parent=parent,*args)
         
         #shortname, tooltip
@@ -103,12 +82,9 @@ class WaterTableModel(QtCore.QAbstractTableModel):
         
         col = index.column()
         row = index.row()
-        water = self.waterData[row]
         
-        if not water.status:
-            return QtCore.QVariant(-1)
-        value = columnIdToPropertyValue(col,water)
-        if value == -1:
+        value = columnIdToPropertyValue(col,self.waterData,row)
+        if np.isnan(value):
             return QtCore.QVariant()
         #note values needs to be converted to a float
         #QVariant doesn't work with numpy.float64 or the likes
@@ -131,13 +107,11 @@ class WaterTableModel(QtCore.QAbstractTableModel):
         self.endResetModel()
         
     def removeProps(self,indeces2rem):
-        objsToRem = list()
-        for index in indeces2rem:
-            objsToRem.append(self.waterData[index])
+        keep = np.ones(len(self.waterData),dtype=bool)
+        keep[list(indeces2rem)] = False
         
         self.beginResetModel()
-        for obj in objsToRem:
-            self.waterData.remove(obj)
+        self.waterData = self.waterData[keep]
         self.endResetModel()
         
     def addWater(self,water):
@@ -193,52 +167,54 @@ class Calculator(QtGui.QMainWindow):
     def input_properties_changed(self,e):
         ind = self.ui.input_selector.currentIndex()
         if len(self.waterTableModel.waterData) == 0:
-            water = iapws(P=0.1,T=300.14)
+            default = iapws(P=0.1,T=300.14)
+            water = {"P": default.P, "T": default.T, "h": default.h,
+                     "s": default.s, "x": default.x}
         else:
             water = self.waterTableModel.waterData[-1]
             
         if ind < 4:
             input1 = "Pressure"
             input1_unit = "[bar]"
-            self.ui.input1.setText("%g" %(water.P*10))
+            self.ui.input1.setText("%g" %(water["P"]*10))
             self.ui.input1.setValidator(self.positive_float_validator)
             if ind == 0:
                 input2 = "Temperature"
                 input2_unit = "[C]"
-                self.ui.input2.setText("%g" %(water.T-273.14))
+                self.ui.input2.setText("%g" %(water["T"]-273.14))
                 self.ui.input2.setValidator(self.temperature_validator)
             elif ind == 1:
                 input2 = "Enthalpy"
                 input2_unit = "[kJ/kg]"
-                self.ui.input2.setText("%g" %water.h)
+                self.ui.input2.setText("%g" %water["h"])
                 self.ui.input2.setValidator(self.positive_float_validator)
             elif ind == 2:
                 input2 = "Enthropy"
                 input2_unit = "[kJ/kg K]"
-                self.ui.input2.setText("%g" %water.s)
+                self.ui.input2.setText("%g" %water["s"])
                 self.ui.input2.setValidator(self.positive_float_validator)
             elif ind == 3:
                 input2 = "Quality"
                 input2_unit = "[-]"
-                self.ui.input2.setText("%g" %water.x)
+                self.ui.input2.setText("%g" %water["x"])
                 self.ui.input2.setValidator(self.unit_validator)
         elif ind == 4:
             input1 = "Temperature"
             input1_unit = "[C]"
-            self.ui.input1.setText("%g" %(water.T-273.14))
+            self.ui.input1.setText("%g" %(water["T"]-273.14))
             self.ui.input1.setValidator(self.temperature_validator)
             input2 = "Quality"
             input2_unit = "[-]"
-            self.ui.input2.setText("%g" %water.x)
+            self.ui.input2.setText("%g" %water["x"])
             self.ui.input2.setValidator(self.unit_validator)
         elif ind == 5:
             input1 = "Enthalpy"
             input1_unit = "[kJ/kg]"
-            self.ui.input1.setText("%g" %water.h)
+            self.ui.input1.setText("%g" %water["h"])
             self.ui.input1.setValidator(self.positive_float_validator)
             input2 = "Enthropy"
             input2_unit = "[kJ/kg K]"
-            self.ui.input2.setText("%g" %water.s)
+            self.ui.input2.setText("%g" %water["s"])
             self.ui.input2.setValidator(self.positive_float_validator)
         self.ui.label_input1.setText(input1)
         self.ui.label_input1_unit.setText(input1_unit)
@@ -258,17 +234,17 @@ class Calculator(QtGui.QMainWindow):
             if ind < 4:
                 input1 /= 10.0 #convert bar to MPa
                 if ind == 0:
-                    water = iapws(P=input1,T=input2+273.14)
+                    water = iapws(P=input1,T=input2+273.14,props=columnProperties)
                 elif ind == 1:
-                    water = iapws(P=input1,h=input2)
+                    water = iapws(P=input1,h=input2,props=columnProperties)
                 elif ind == 2:
-                    water = iapws(P=input1,s=input2)
+                    water = iapws(P=input1,s=input2,props=columnProperties)
                 elif ind == 3:
-                    water = iapws(P=input1,x=input2)
+                    water = iapws(P=input1,x=input2,props=columnProperties)
             elif ind == 4:
-                water = iapws(T=input1+273.14,x=input2)
+                water = iapws(T=input1+273.14,x=input2,props=columnProperties)
             elif ind == 5:
-                water = iapws(h=input1,s=input2)
+                water = iapws(h=input1,s=input2,props=columnProperties)
         except NotImplementedError:
             QtGui.QMessageBox.warning(self,"Bad input",
             "You've input bad values either out of bounds or not yet implemented.",
@@ -351,14 +327,11 @@ You should have received a copy of the GNU General Public License along with H2O
         
         for row in selRows:
             data += "<tr>\n"
-            water = self.waterTableModel.waterData[row]
             for col in selCols:
                 data += " <td> "
-                value = columnIdToPropertyValue(col,water)
-                if value == -1:
-                    data += "-"
-                else:
-                    data += "%g" %value
+                value = columnIdToPropertyValue(
+                            col,self.waterTableModel.waterData,row)
+                data += "%g" %value
                 data += " </td>\n"
             data += "</tr>\n"
         data += "</table>\n"
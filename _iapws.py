@@ -186,6 +186,17 @@ def _Melting_Pressure(T, P):
 
 
 # Transport properties
+# Coefficients for the viscosity, ideal-gas and residual parts
+_Viscosity_no = (1.67752, 2.20462, 0.6366564, -0.241605)
+_Viscosity_I = (0, 0, 0, 0, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 3, 3, 4, 4, 5, 6, 6)
+_Viscosity_J = (0, 1, 2, 3, 0, 1, 2, 3, 5, 0, 1, 2, 3, 4, 0, 1, 0, 3, 4, 3, 5)
+_Viscosity_nr = (0.520094, 0.850895e-1, -0.108374e1, -0.289555, 0.222531,
+                 0.999115, 0.188797e1, 0.126613e1, 0.120573, -0.281378,
+                 -0.906851, -0.772479, -0.489837, -0.257040, 0.161913,
+                 0.257399, -0.325372e-1, 0.698452e-1, 0.872102e-2,
+                 -0.435673e-2, -0.593264e-3)
+
+
 def _Viscosity(rho, T, fase=None, drho=None):
     """Equation for the Viscosity
 
@@ -197,21 +208,14 @@ def _Viscosity(rho, T, fase=None, drho=None):
     Tr = T/Tc
     Dr = rho/rhoc
 
-    no = [1.67752, 2.20462, 0.6366564, -0.241605]
     suma = 0
-    for i in range(4):
-        suma += no[i]/Tr**i
+    for i, no in enumerate(_Viscosity_no):
+        suma += no/Tr**i
     fi0 = 100*Tr**0.5/suma
 
-    I = [0, 0, 0, 0, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 3, 3, 4, 4, 5, 6, 6]
-    J = [0, 1, 2, 3, 0, 1, 2, 3, 5, 0, 1, 2, 3, 4, 0, 1, 0, 3, 4, 3, 5]
-    nr = [0.520094, 0.850895e-1, -0.108374e1, -0.289555, 0.222531, 0.999115,
-          0.188797e1, 0.126613e1, 0.120573, -0.281378, -0.906851, -0.772479,
-          -0.489837, -0.257040, 0.161913, 0.257399, -0.325372e-1, 0.698452e-1,
-          0.872102e-2, -0.435673e-2, -0.593264e-3]
     suma = 0
-    for i in range(21):
-        suma += nr[i]*(Dr-1)**I[i]*(1/Tr-1)**J[i]
+    for nr, I, J in zip(_Viscosity_nr, _Viscosity_I, _Viscosity_J):
+        suma += nr*(Dr-1)**I*(1/Tr-1)**J
     fi1 = exp(Dr*suma)
     if fase and drho:
         qc = 1/1.9
@@ -238,6 +242,21 @@ def _Viscosity(rho, T, fase=None, drho=None):
     return fi0*fi1*fi2*1e-6
 
 
+# Coefficients for the thermal conductivity, ideal-gas and residual parts
+_ThCond_no = (2.443221e-3, 1.323095e-2, 6.770357e-3, -3.454586e-3,
+              4.096266e-4)
+_ThCond_nij = (
+    (1.60397357, -0.646013523, 0.111443906, 0.102997357, -0.0504123634,
+     0.00609859258),
+    (2.33771842, -2.78843778, 1.53616167, -0.463045512, 0.0832827019,
+     -0.00719201245),
+    (2.19650529, -4.54580785, 3.55777244, -1.40944978, 0.275418278,
+     -0.0205938816),
+    (-1.21051378, 1.60812989, -0.621178141, 0.0716373224, 0, 0),
+    (-2.7203370, 4.57586331, -3.18369245, 1.1168348, -0.19268305,
+     0.012913842))
+
+
 def _ThCond(rho, T, fase=None, drho=None):
     """Equation for the thermal conductivity
 
@@ -249,23 +268,16 @@ def _ThCond(rho, T, fase=None, drho=None):
     d = rho/322.
     Tr = T/647.096
 
-    no = [2.443221e-3, 1.323095e-2, 6.770357e-3, -3.454586e-3, 4.096266e-4]
     suma = 0
-    for i in range(5):
-        suma += no[i]/Tr**i
+    for i, no in enumerate(_ThCond_no):
+        suma += no/Tr**i
     L0 = Tr**0.5/suma
 
-    nij = [
-        [1.60397357, -0.646013523, 0.111443906, 0.102997357, -0.0504123634, 0.00609859258],
-        [2.33771842, -2.78843778, 1.53616167, -0.463045512, 0.0832827019, -0.00719201245],
-        [2.19650529, -4.54580785, 3.55777244, -1.40944978, 0.275418278, -0.0205938816],
-        [-1.21051378, 1.60812989, -0.621178141, 0.0716373224, 0, 0],
-        [-2.7203370, 4.57586331, -3.18369245, 1.1168348, -0.19268305, 0.012913842]]
     suma = 0
-    for i in range(len(nij)):
+    for i, ni in enumerate(_ThCond_nij):
         suma2 = 0
-        for j in range(len(nij[i])):
-            suma2 += nij[i][j]*(d-1)**j
+        for j, nij in enumerate(ni):
+            suma2 += nij*(d-1)**j
         suma += (1/Tr-1)**i*suma2
     L1 = exp(d*suma)
 
@@ -301,6 +313,16 @@ def _Tension(T):
         return 0
 
 
+# Coefficients for the dielectric constant, the last term of n is the one
+# without exponents
+_Dielectric_I = (1, 1, 1, 2, 3, 3, 4, 5, 6, 7, 10)
+_Dielectric_J = (0.25, 1, 2.5, 1.5, 1.5, 2.5, 2, 2, 5, 0.5, 10)
+_Dielectric_n = (0.978224486826, -0.957771379375, 0.237511794148,
+                 0.714692244396, -0.298217036956, -0.108863472196,
+                 .949327488264e-1, -.980469816509e-2, .165167634970e-4,
+                 .937359795772e-4, -.12317921872e-9, .196096504426e-2)
+
+
 def _Dielectric(rho, T):
     """Equation for the Dielectric constant
 
@@ -318,15 +340,9 @@ def _Dielectric(rho, T):
 
     d = rho/rhoc
     Tr = Tc/T
-    I = [1, 1, 1, 2, 3, 3, 4, 5, 6, 7, 10, None]
-    J = [0.25, 1, 2.5, 1.5, 1.5, 2.5, 2, 2, 5, 0.5, 10, None]
-    n = [0.978224486826, -0.957771379375, 0.237511794148, 0.714692244396,
-         -0.298217036956, -0.108863472196, .949327488264e-1, -.980469816509e-2,
-         .165167634970e-4, .937359795772e-4, -.12317921872e-9, .196096504426e-2]
-
-    g = 1+n[11]*d/(Tc/228/Tr-1)**1.2
-    for i in range(11):
-        g += n[i]*d**I[i]*Tr**J[i]
+    g = 1+_Dielectric_n[11]*d/(Tc/228/Tr-1)**1.2
+    for n, I, J in zip(_Dielectric_n, _Dielectric_I, _Dielectric_J):
+        g += n*d**I*Tr**J
     A = Na*mu**2*rho*g/M/epsilon0/k/T
     B = Na*alfa*rho/3/M/epsilon0
     e = (1+A+5*B+(9+2*A+18*B+A**2+10*A*B+9*B**2)**0.5)/4/(1-B)
@@ -353,41 +369,62 @@ def _Refractive(rho, T, l=0.5893):
     return ((2*A+1)/(1-A))**0.5
 
 
+class _lazy(object):
+    """Property of a phase calculated on first access
+
+    The value is stored in the _cache dict of the instance, so the
+    calculation is done only once, and can be set directly too. Phases not
+    filled by a state, _owner None, return None"""
+    slot = "_cache"
+
+    def __init__(self, funcion):
+        self.funcion = funcion
+        self.name = funcion.__name__
+        self.__doc__ = funcion.__doc__
+
+    def __get__(self, instance, cls):
+        if instance is None:
+            return self
+        cache = getattr(instance, self.slot)
+        if cache is not None and self.name in cache:
+            return cache[self.name]
+        if instance._owner is None:
+            return None
+        value = self.funcion(instance)
+        self.__set__(instance, value)
+        return value
+
+    def __set__(self, instance, value):
+        cache = getattr(instance, self.slot)
+        if cache is None:
+            cache = {}
+            setattr(instance, self.slot, cache)
+        cache[self.name] = value
+
+
+class _lazy_state(_lazy):
+    """Lazy property of a phase depending on the state that fill it, not
+    only on the phase and T, P. Stored in the _state_cache dict, which is
+    never shared between the states, unlike _cache"""
+    slot = "_state_cache"
+
+
 class _fase(object):
-    """Class to implement a null phase"""
-    v = None
-    rho = None
-
-    h = None
-    s = None
-    u = None
-    a = None
-    g = None
-
-    cp = None
-    cv = None
-    cp_cv = None
-    w = None
-    Z = None
+    """Class to implement a null phase
+
+    The state filling the phase is saved in _owner, with T, P, kwargs, the
+    ideal gas properties _prop0 and the derivative method used by the lazy
+    transport, electrical, optical, ideal gas and derivative properties.
+    The calculated properties are kept in __slots__ to save memory when
+    many states are stored, the not implemented ones are always None"""
+    __slots__ = ("_owner", "_cache", "_state_cache", "v", "rho", "h", "s",
+                 "u", "a", "g", "cp", "cv", "cp_cv", "w", "Z", "alfav",
+                 "xkappa")
+
     fi = None
-    f = None
-
-    mu = None
-    k = None
-    nu = None
-    Prandt = None
-    epsilon = None
-    alfa = None
-    n = None
-
-    alfap = None
-    betap = None
-    joule = None
     Gruneisen = None
-    alfav = None
     kappa = None
     betas = None
-    gamma = None
     Kt = None
     kt = None
     Ks = None
@@ -407,6 +444,144 @@ class _fase(object):
     IntP = None
     hInput = None
 
+    def __init__(self):
+        for key in _fase.__slots__:
+            setattr(self, key, None)
+
+    @_lazy
+    def mu(self):
+        """Dynamic viscosity, Pa·s"""
+        return _Viscosity(self.rho, self._owner.T)
+
+    @_lazy
+    def k(self):
+        """Thermal conductivity, W/m·K"""
+        return _ThCond(self.rho, self._owner.T)
+
+    @_lazy
+    def nu(self):
+        """Kinematic viscosity, m²/s"""
+        return self.mu/self.rho
+
+    @_lazy
+    def Prandt(self):
+        """Prandtl number"""
+        return self.mu*self.cp*1000/self.k
+
+    @_lazy
+    def alfa(self):
+        """Thermal diffusivity, m²/s"""
+        return self.k/1000/self.rho/self.cp
+
+    @_lazy
+    def epsilon(self):
+        """Dielectric constant"""
+        return _Dielectric(self.rho, self._owner.T)
+
+    @_lazy
+    def n(self):
+        """Refractive index"""
+        return _Refractive(self.rho, self._owner.T, self._owner.kwargs["l"])
+
+    @_lazy
+    def joule(self):
+        """Joule-Thomson coefficient, K/MPa"""
+        return self._owner.derivative("T", "P", "h", self)
+
+    @_lazy
+    def deltat(self):
+        """Isothermal throttling coefficient, kJ/kg·MPa"""
+        return self._owner.derivative("h", "P", "T", self)
+
+    @_lazy_state
+    def gamma(self):
+        """Isoentropic exponent"""
+        state = self._owner
+        return -state.v/state.P/1000*state.derivative("P", "v", "s", self)
+
+    @_lazy
+    def v0(self):
+        """Ideal specific volume, m³/kg"""
+        return self._owner._prop0.v
+
+    @_lazy
+    def h0(self):
+        """Ideal specific enthalpy, kJ/kg"""
+        return self._owner._prop0.h
+
+    @_lazy
+    def u0(self):
+        """Ideal specific internal energy, kJ/kg"""
+        return self.h0-self._owner.P*1000*self.v0
+
+    @_lazy
+    def s0(self):
+        """Ideal specific entropy, kJ/kg·K"""
+        return self._owner._prop0.s
+
+    @_lazy
+    def a0(self):
+        """Ideal specific Helmholtz free energy, kJ/kg"""
+        return self.u0-self._owner.T*self.s0
+
+    @_lazy
+    def g0(self):
+        """Ideal specific Gibbs free energy, kJ/kg"""
+        return self.h0-self._owner.T*self.s0
+
+    @_lazy
+    def cp0(self):
+        """Ideal specific isobaric heat capacity, kJ/kg·K"""
+        return self._owner._prop0.cp
+
+    @_lazy
+    def cv0(self):
+        """Ideal specific isochoric heat capacity, kJ/kg·K"""
+        return self._owner._prop0.cv
+
+    @_lazy
+    def cp0_cv(self):
+        """Ideal heat capacities ratio"""
+        return self.cp0/self.cv0
+
+    @_lazy
+    def w0(self):
+        """Ideal speed of sound, m/s"""
+        return self._owner._prop0.w
+
+    @_lazy
+    def gamma0(self):
+        """Ideal isoentropic exponent"""
+        return self._owner._prop0.gamma
+
+    @_lazy
+    def f(self):
+        """Fugacity, MPa"""
+        state = self._owner
+        return state.P*exp((self.g-self.g0)/R/state.T)
+
+    @_lazy
+    def alfap(self):
+        """Relative pressure coefficient, 1/K"""
+        return self.alfav/self._owner.P/self.xkappa
+
+    @_lazy
+    def betap(self):
+        """Isothermal stress coefficient, kg/m³"""
+        state = self._owner
+        return -1/state.P/1000*state.derivative("P", "v", "T", self)
+
+    def _clear(self):
+        """Forget the lazy properties of a previous calculation"""
+        self._cache = None
+        self._state_cache = None
+        self._owner = None
+
+
+# Name of the properties of _fase calculated on first access
+_fase._lazy = tuple(key for key, value in vars(_fase).items()
+                    if isinstance(value, _lazy))
+
 
 if __name__ == "__main__":
     import doctest
@@ -0,0 +1,117 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"Benchmarks of the IAPWS-IF97 implementation"
+
+from __future__ import division, print_function
+
+import json
+import os
+import subprocess
+import sys
+from timeit import repeat
+
+from iapws97 import IAPWS97
+from iapws97_array import IAPWS97Batch, StateTable
+
+
+def memory_footprint(n=10000):
+    """Memory used by each IAPWS97 state, in bytes
+
+    Create n states of liquid water and measure the memory allocated with
+    tracemalloc (python 3.4+), the states with the lazy properties
+    calculated too, because they are stored in the phases once read, and
+    the same states kept in a StateTable"""
+    import tracemalloc
+
+    footprint = {}
+    for label, props in (("basic", None),
+                         ("GUI columns", ["k", "alfa", "Prandt", "nu", "mu"])):
+        tracemalloc.start()
+        states = [IAPWS97(T=300+i*0.01, P=1, props=props) for i in range(n)]
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        footprint[label] = memory/len(states)
+
+    batch = IAPWS97Batch(T=[300+i*0.01 for i in range(n)], P=1)
+    tracemalloc.start()
+    table = StateTable()
+    table.extend(batch)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    footprint["StateTable"] = memory/len(table)
+    return footprint
+
+
+# Calls timed by micro_benchmark, with the module of each function
+_calls = (
+    ("iapws97", "_Region1", "_Region1(300, 3)"),
+    ("iapws97", "_Region2", "_Region2(700, 30)"),
+    ("iapws97", "_Region3", "_Region3(500, 650)"),
+    ("iapws97", "_Region5", "_Region5(1500, 0.5)"),
+    ("iapws97", "_Backward1_T_Ph", "_Backward1_T_Ph(3, 500)"),
+    ("iapws97", "_Backward2a_T_Ph", "_Backward2a_T_Ph(0.001, 3000)"),
+    ("iapws97", "_Backward3a_v_Ph", "_Backward3a_v_Ph(20, 1700)"),
+    ("iapws97", "_Backward3x_v_PT", "_Backward3x_v_PT(630, 50, 'a')"),
+    ("iapws97", "_Backward4_T_hs", "_Backward4_T_hs(1800, 5.3)"),
+    ("_iapws", "_Viscosity", "_Viscosity(998, 298.15)"),
+    ("_iapws", "_ThCond", "_ThCond(998, 298.15)"),
+    ("_iapws", "_Dielectric", "_Dielectric(1000, 298.15)"))
+
+# Script timing the calls with the modules of other directory, it can't
+# import this module, the other version may lack iapws97_array
+_script = """
+import json, sys
+import json
+import os
+import subprocess
+import sys
+from timeit import repeat
+sys.path.insert(0, %r)
+times = {}
+for module, name, call in %r:
+    setup = "from %%s import %%s" %% (module, name)
+    times[name] = min(repeat(call, setup, number=%i, repeat=5))/%i*1e6
+print(json.dumps(times))
+"""
+
+
+def micro_benchmark(number=10000, baseline=None):
+    """Time by call, in microseconds, of the basic and backward equations
+
+    Each equation is called number times at a state of its region, the
+    time is the best of five runs. With
+    baseline, the directory of other version of the modules, as a checkout
+    of an older commit, the same calls are timed with that version in a
+    subprocess, and each time is returned as a tuple (time, time with the
+    baseline, speedup), so the harness itself compares both versions"""
+    times = {}
+    for module, name, call in _calls:
+        setup = "from %s import %s" % (module, name)
+        times[name] = min(repeat(call, setup, number=number,
+                                 repeat=5))/number*1e6
+    if baseline is None:
+        return times
+
+    script = _script % (os.path.abspath(baseline), _calls, number, number)
+    output = subprocess.check_output([sys.executable, "-c", script],
+                                     cwd=baseline)
+    reference = json.loads(output.decode("ascii"))
+    comparison = {}
+    for name, time in times.items():
+        comparison[name] = (time, reference[name], reference[name]/time)
+    return comparison
+
+
+if __name__ == "__main__":
+    for label, memory in sorted(memory_footprint().items()):
+        print("Memory by state, %s: %i bytes" % (label, memory))
+    # The directory of a baseline version can be given as argument
+    if len(sys.argv) > 1:
+        comparison = micro_benchmark(baseline=sys.argv[1])
+        for name, (time, reference, speedup) in sorted(comparison.items()):
+            print("Time by call, %s: %.2f us, baseline %.2f us, speedup "
+                  "%.2f" % (name, time, reference, speedup))
+    else:
+        for name, time in sorted(micro_benchmark().items()):
+            print("Time by call, %s: %.2f us" % (name, time))
@@ -0,0 +1,1663 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""IAPWS-IF97 Steam Tables implementation over numpy arrays
+
+The module works with the same Python versions than iapws97, except
+solve_parallel, which needs Python 3.8+ for multiprocessing.shared_memory.
+The modules it needs are imported in the call, so importing this module
+works with older versions too.
+"""
+
+from __future__ import division
+
+import numpy as np
+
+from _iapws import R, Tc, Pc, rhoc, Tt, Pt
+from iapws97 import Pmin, Ps_623, _options, _Region3_derivatives
+from iapws97 import sc, _t_P, _P23_T, _t_hs, _h13_s, _h1_s, _h3a_s
+from iapws97 import _h2c3b_s, _h2ab_s_I, _h2ab_s_J, _h2ab_s_n, _hbc_P
+from iapws97 import _hmin_Ps3, _hmax_Ps3, _PSat_h_I, _PSat_h_J, _PSat_h_n
+from iapws97 import _PSat_s_I, _PSat_s_J, _PSat_s_n
+from iapws97 import _Backward1_T_Ph, _Backward1_T_Ps, _Backward1_P_hs
+from iapws97 import _Backward2a_T_Ph, _Backward2b_T_Ph, _Backward2c_T_Ph
+from iapws97 import _Backward2a_T_Ps, _Backward2b_T_Ps, _Backward2c_T_Ps
+from iapws97 import _Backward2a_P_hs, _Backward2b_P_hs, _Backward2c_P_hs
+from iapws97 import _h_3ab, _Backward3a_v_Ph, _Backward3b_v_Ph
+from iapws97 import _Backward3a_T_Ph, _Backward3b_T_Ph
+from iapws97 import _Backward3a_v_Ps, _Backward3b_v_Ps
+from iapws97 import _Backward3a_T_Ps, _Backward3b_T_Ps
+from iapws97 import _Backward3a_P_hs, _Backward3b_P_hs
+from iapws97 import _hs_smin, _hs_hmin, _hs_s13, _hs_s13s, _hs_smax
+from iapws97 import _hs_hmax, _hs_s4l, _hs_h4l, _hs_s4v, _hs_h4v
+from iapws97 import _hs_h23max, _hs_h23min, _hs_s5min, _hs_h5min
+from iapws97 import _hs_s5max, _hs_h5max
+from iapws97 import _tab_P_I, _tab_P_n, _top_P_I, _top_P_n, _twx_P_I
+from iapws97 import _twx_P_n, _tef_P, _txx_P, _txx_P_n
+from iapws97 import _Backward3x_v_PT_par, _Backward3x_v_PT_terms
+from iapws97 import _Backward4_T_hs, _Region4_n
+from iapws97 import _derivatives, _Region1_polynomial, _Region2_polynomial
+from iapws97 import _Region2_cp0_J, _Region2_cp0_n
+from iapws97 import _Region3_polynomial, _Region3_n1, _Region5_polynomial
+from iapws97 import _Region5_cp0_J, _Region5_cp0_n
+
+
+def _asarrays(*args):
+    """Convert the inputs to float arrays broadcasted to a common shape"""
+    return np.broadcast_arrays(*[np.asarray(a, dtype=float) for a in args])
+
+
+def _piecewise(args, cases):
+    """Evaluate a function by pieces over arrays
+
+    args are the arrays of the arguments and cases a sequence of pairs
+    (condition, funcion), each point is evaluated with the function of its
+    first true condition, the points without any are nan. The functions
+    are the scalar equations of iapws97 made only of arithmetic, so they
+    work over the subsets of the arrays"""
+    value = np.full(args[0].shape, np.nan)
+    rest = np.ones(args[0].shape, dtype=bool)
+    with np.errstate(all="ignore"):
+        for condition, funcion in cases:
+            idx = rest & condition
+            if idx.any():
+                value[idx] = funcion(*[arg[idx] for arg in args])
+            rest &= ~idx
+    return value
+
+
+# Saturated line
+def _PSat_T(T):
+    """Define the saturated line, P=f(T), over an array of T
+
+    >>> "%.8f" % _PSat_T([500])[0]
+    '2.63889776'
+    """
+    T = np.clip(np.asarray(T, dtype=float), 273.15, Tc)
+    n = _Region4_n
+    tita = T+n[9]/(T-n[10])
+    A = tita**2+n[1]*tita+n[2]
+    B = n[3]*tita**2+n[4]*tita+n[5]
+    C = n[6]*tita**2+n[7]*tita+n[8]
+    return (2*C/(-B+(B**2-4*A*C)**0.5))**4
+
+
+def _TSat_P(P):
+    """Define the saturated line, T=f(P), over an array of P
+
+    >>> "%.6f" % _TSat_P([10])[0]
+    '584.149488'
+    """
+    P = np.clip(np.asarray(P, dtype=float), 611.212677/1e6, 22.064)
+    n = _Region4_n
+    beta = P**0.25
+    E = beta**2+n[3]*beta+n[6]
+    F = n[1]*beta**2+n[4]*beta+n[7]
+    G = n[2]*beta**2+n[5]*beta+n[8]
+    D = 2*G/(-F-(F**2-4*E*G)**0.5)
+    return (n[10]+D-((n[10]+D)**2-4*(n[9]+n[10]*D))**0.5)/2
+
+
+# Region boundaries
+def _Bound_TP(T, P):
+    """Region definition for input T and P over arrays, as an int8 array of
+    region codes, 0 for out of bound, with the same conditions than
+    iapws97._Bound_TP
+
+    >>> _Bound_TP([300, 700, 650, 1500, 200], [1, 1, 30, 1, 1])
+    array([1, 2, 3, 5, 0], dtype=int8)
+    """
+    T, P = _asarrays(T, P)
+    region = np.zeros(T.shape, dtype=np.int8)
+
+    low = (Pmin <= P) & (P <= Ps_623)
+    Tsat = _TSat_P(P)
+    region[low & (273.15 <= T) & (T <= Tsat)] = 1
+    region[low & (Tsat < T) & (T <= 1073.15)] = 2
+
+    high = (Ps_623 < P) & (P <= 100)
+    with np.errstate(invalid="ignore"):
+        T_b23 = np.where(high, _t_P(np.where(high, P, 100)), np.nan)
+    region[high & (273.15 <= T) & (T <= 623.15)] = 1
+    region[high & (T_b23 <= T) & (T <= 1073.15)] = 2
+    region[high & (623.15 < T) & (T < T_b23)] = 3
+
+    region[(1073.15 < T) & (T <= 2273.15) & (Pmin <= P) & (P <= 50)] = 5
+    return region
+
+
+# Region 1
+def _Region1(T, P):
+    """Basic equation for region 1 over arrays of T and P
+
+    Return the same keys as iapws97._Region1, each one as a contiguous array
+    with the broadcasted shape of the inputs
+
+    >>> p = _Region1([300, 300, 500], [3, 80, 3])
+    >>> "%.11f" % p["v"][0]
+    '0.00100215168'
+    >>> "%.6f" % p["h"][0]
+    '115.331273'
+    >>> "%.9f" % p["s"][1]
+    '0.368563852'
+    >>> "%.8f %.8f" % (p["cp"][1], p["cv"][1])
+    '4.01008987 3.91736606'
+    >>> "%.5f" % p["w"][2]
+    '1240.71337'
+    >>> "%.11f %.11f" % (p["alfav"][2], p["kt"][2])
+    '0.00164118128 0.00112892188'
+    """
+    T, P = _asarrays(T, P)
+    Tr = 1386/T
+    Pr = P/16.53
+    g, gp, gpp, gt, gtt, gpt = _derivatives(_Region1_polynomial, 7.1-Pr,
+                                            Tr-1.222)
+    gp = -gp
+    gpt = -gpt
+
+    propiedades = {}
+    propiedades["T"] = T.copy()
+    propiedades["P"] = P.copy()
+    propiedades["v"] = Pr*gp*R*T/P/1000
+    propiedades["h"] = Tr*gt*R*T
+    propiedades["s"] = R*(Tr*gt-g)
+    propiedades["cp"] = -R*Tr**2*gtt
+    propiedades["cv"] = R*(-Tr**2*gtt+(gp-Tr*gpt)**2/gpp)
+    propiedades["w"] = np.sqrt(
+        R*T*1000*gp**2/((gp-Tr*gpt)**2/(Tr**2*gtt)-gpp))
+    propiedades["alfav"] = (1-Tr*gpt/gp)/T
+    propiedades["kt"] = -Pr*gpp/gp/P
+    propiedades["region"] = 1
+    propiedades["x"] = 0
+    return propiedades
+
+
+# Region 2
+def _Region2(T, P):
+    """Basic equation for region 2 over arrays of T and P
+
+    >>> p = _Region2([700, 700, 300], [30, 0.0035, 0.0035])
+    >>> "%.11f" % p["v"][0]
+    '0.00542946619'
+    >>> "%.5f" % p["h"][0]
+    '2631.49474'
+    >>> "%.7f" % p["s"][1]
+    '10.1749996'
+    >>> "%.8f %.8f" % (p["cp"][1], p["cv"][1])
+    '2.08141274 1.61978333'
+    >>> "%.6f" % p["w"][2]
+    '427.920172'
+    >>> "%.11f %.6f" % (p["alfav"][2], p["kt"][2])
+    '0.00337578289 286.239651'
+    """
+    T, P = _asarrays(T, P)
+    Tr = 540/T
+    Pr = P/1
+
+    go, gop, gopp, got, gott, gopt = Region2_cp0(Tr, Pr)
+
+    gr, grp, grpp, grt, grtt, grpt = _derivatives(_Region2_polynomial, Pr,
+                                                  Tr-0.5)
+
+    propiedades = {}
+    propiedades["T"] = T.copy()
+    propiedades["P"] = P.copy()
+    propiedades["v"] = Pr*(gop+grp)*R*T/P/1000
+    propiedades["h"] = Tr*(got+grt)*R*T
+    propiedades["s"] = R*(Tr*(got+grt)-(go+gr))
+    propiedades["cp"] = -R*Tr**2*(gott+grtt)
+    propiedades["cv"] = R*(-Tr**2*(gott+grtt)-(1+Pr*grp-Tr*Pr*grpt)**2/(
+        1-Pr**2*grpp))
+    propiedades["w"] = np.sqrt(R*T*1000*(1+2*Pr*grp+Pr**2*grp**2)/(
+        1-Pr**2*grpp+(1+Pr*grp-Tr*Pr*grpt)**2/Tr**2/(gott+grtt)))
+    propiedades["alfav"] = (1+Pr*grp-Tr*Pr*grpt)/(1+Pr*grp)/T
+    propiedades["kt"] = (1-Pr**2*grpp)/(1+Pr*grp)/P
+    propiedades["region"] = 2
+    propiedades["x"] = 1
+    return propiedades
+
+
+def Region2_cp0(Tr, Pr):
+    """Ideal properties for Region 2 over arrays of Tr and Pr"""
+    Tr, Pr = _asarrays(Tr, Pr)
+    go = np.log(Pr)
+    gop = Pr**-1
+    gopp = -Pr**-2
+    got = np.zeros(Tr.shape)
+    gott = np.zeros(Tr.shape)
+    gopt = np.zeros(Tr.shape)
+    for no, Jo in zip(_Region2_cp0_n, _Region2_cp0_J):
+        go += no*Tr**Jo
+        got += no*Jo*Tr**(Jo-1)
+        gott += no*Jo*(Jo-1)*Tr**(Jo-2)
+    return go, gop, gopp, got, gott, gopt
+
+
+# Region 3
+def _Region3(rho, T):
+    """Basic equation for region 3 over arrays of rho and T
+
+    Besides the properties of iapws97._Region3 the returned dict include the
+    reduced Helmholtz free energy g and its derivatives gd, gdd, gt, gtt, gdt
+    with respect to the reduced density d and inverse temperature Tr
+
+    >>> p = _Region3([500, 200, 500], [650, 650, 750])
+    >>> "%.7f %.5f" % (p["P"][0], p["h"][0])
+    '25.5837018 1863.43019'
+    >>> "%.8f %.7f %.8f" % (p["s"][1], p["cp"][1], p["cv"][1])
+    '4.85438792 44.6579342 4.04118076'
+    >>> "%.6f" % p["w"][1]
+    '383.444594'
+    >>> "%.11f %.11f" % (p["alfav"][2], p["kt"][2])
+    '0.00441515098 0.00806710817'
+    >>> "%.11f %.6f" % (p["alfap"][2], p["betap"][2])
+    '0.00698896514 791.475213'
+    >>> "%.7f" % (p["d"][0]*p["gd"][0]*R*650*500/1000)
+    '25.5837018'
+    """
+    rho, T = _asarrays(rho, T)
+    d = rho/rhoc
+    Tr = Tc/T
+    g, gd, gdd, gt, gtt, gdt = _derivatives(_Region3_polynomial, d, Tr)
+    g += _Region3_n1*np.log(d)
+    gd += _Region3_n1*d**-1
+    gdd -= _Region3_n1*d**-2
+
+    propiedades = {}
+    propiedades["T"] = T.copy()
+    propiedades["P"] = d*gd*R*T*rho/1000
+    propiedades["v"] = 1/rho
+    propiedades["h"] = R*T*(Tr*gt+d*gd)
+    propiedades["s"] = R*(Tr*gt-g)
+    propiedades["cp"] = R*(-Tr**2*gtt+(d*gd-d*Tr*gdt)**2/(2*d*gd+d**2*gdd))
+    propiedades["cv"] = -R*Tr**2*gtt
+    propiedades["w"] = np.sqrt(
+        R*T*1000*(2*d*gd+d**2*gdd-(d*gd-d*Tr*gdt)**2/Tr**2/gtt))
+    propiedades["alfav"] = (gd-Tr*gdt)/(2*gd+d*gdd)/T
+    propiedades["kt"] = 1/(2*d*gd+d**2*gdd)/rho/R/T*1000
+    propiedades["alfap"] = (1-Tr*gdt/gd)/T
+    propiedades["betap"] = rho*(2+d*gdd/gd)
+    propiedades["region"] = 3
+    propiedades["x"] = 1
+    propiedades["d"] = d
+    propiedades["Tr"] = Tr
+    propiedades["g"] = g
+    propiedades["gd"] = gd
+    propiedades["gdd"] = gdd
+    propiedades["gt"] = gt
+    propiedades["gtt"] = gtt
+    propiedades["gdt"] = gdt
+    return propiedades
+
+
+# Region 3 backward equation v=f(P,T)
+def _tlog_P(P, n, I):
+    """Boundary between region 3 subregions as polynomial of ln(P), for
+    the coefficients of _tab_P, _top_P and _twx_P, over an array of P"""
+    lnP = np.log(P)
+    T = 0
+    for ni, Ii in zip(n, I):
+        T = T+ni*lnP**Ii
+    return T
+
+
+_subregions = "abcdefghijklmnopqrstuvwxyz"
+
+
+def _select(T, bounds, letters):
+    """Subregion codes for T in the first interval of bounds containing it,
+    so letters has one letter more than bounds"""
+    code = np.full(T.shape, _subregions.index(letters[-1]), dtype=np.int8)
+    for bound, letter in reversed(list(zip(bounds, letters))):
+        code[T <= bound] = _subregions.index(letter)
+    return code
+
+
+def _Region3_subregion(P, T):
+    """Subregion of region 3 for the backward equation v=f(P,T), over arrays
+    of P and T, as index in _subregions, -1 out of region 3
+
+    The boundaries are evaluated once for all the array and the points are
+    classified by pressure bands with the same conditions than
+    iapws97._Backward3_v_PT
+
+    >>> code = _Region3_subregion([50, 30, 23.6, 22.8, 22.3, 21, 17],
+    ...                           [630, 690, 652, 650.5, 647.7, 643, 650])
+    >>> "".join(_subregions[i] for i in code)
+    'afhpurt'
+    """
+    P, T = _asarrays(P, T)
+    code = np.full(P.shape, -1, dtype=np.int8)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        tab = _tlog_P(P, _tab_P_n, _tab_P_I)
+        top = _tlog_P(P, _top_P_n, _top_P_I)
+        twx = _tlog_P(P, _twx_P_n, _twx_P_I)
+    tef = _tef_P(P)
+    t = dict((xx, _txx_P(P, xx)) for xx in _txx_P_n)
+    Ts = _TSat_P(P)
+    P643 = _PSat_T(643.15)
+    P623 = _PSat_T(623.15)
+
+    bands = (
+        (P > 40, (tab, ), "ab"),
+        ((25 < P) & (P <= 40), (t["cd"], tab, tef), "cdef"),
+        ((23.5 < P) & (P <= 25),
+         (t["cd"], t["gh"], tef, t["ij"], t["jk"]), "cghijk"),
+        ((23 < P) & (P <= 23.5),
+         (t["cd"], t["gh"], tef, t["ij"], t["jk"]), "clhijk"),
+        ((22.5 < P) & (P <= 23),
+         (t["cd"], t["gh"], t["mn"], tef, top, t["ij"], t["jk"]),
+         "clmnopjk"),
+        # The x is replaced below by the near critical subregions
+        ((P643 < P) & (P <= 22.5), (t["cd"], t["qu"], t["rx"], t["jk"]),
+         "cqxrk"),
+        ((20.5 < P) & (P <= P643), (t["cd"], Ts, t["jk"]), "csrk"),
+        ((19.00881189 < P) & (P <= 20.5), (t["cd"], Ts), "cst"),
+        ((P623 < P) & (P <= 19.00881189), (Ts, ), "ct"))
+    for band, bounds, letters in bands:
+        code[band] = _select(T[band], [b[band] for b in bounds], letters)
+
+    # Near critical subregions, between the qu and rx boundaries
+    near = (P643 < P) & (P <= 22.5) & (t["qu"] < T) & (T <= t["rx"])
+    bands = (
+        (near & (22.11 < P), (t["uv"], tef, twx), "uvwx"),
+        (near & (22.064 < P) & (P <= 22.11), (t["uv"], tef, twx), "uyzx"),
+        (near & (P <= 22.064) & (T > Ts) & (P <= 21.90096265), (), "x"),
+        (near & (P <= 22.064) & (T > Ts) & (21.90096265 < P), (twx, ), "zx"),
+        (near & (P <= 22.064) & (T <= Ts) & (P <= 21.93161551), (), "u"),
+        (near & (P <= 22.064) & (T <= Ts) & (21.93161551 < P),
+         (t["uv"], ), "uy"))
+    for band, bounds, letters in bands:
+        code[band] = _select(T[band], [b[band] for b in bounds], letters)
+    return code
+
+
+def _Backward3x_v_PT(T, P, x):
+    """Backward equation for region 3x, v=f(P,T), over arrays of T and P
+
+    >>> "%.12f" % _Backward3x_v_PT(np.array([660.]), 24, "j")[0]
+    '0.005100267704'
+    """
+    v_, P_, T_, N, a, b, c, d, e = _Backward3x_v_PT_par[x]
+    Pr = P/P_
+    Tr = T/T_
+    suma = 0
+    for n, I, J in _Backward3x_v_PT_terms[x]:
+        suma = suma+n*(Pr-a)**I*(Tr-b)**J
+    if x == "n":
+        return v_*np.exp(suma)
+    else:
+        return v_*suma**e
+
+
+def _Backward3_v_PT(P, T):
+    """Backward equation for region 3, v=f(P,T), over arrays of P and T,
+    nan for points out of region 3
+
+    >>> v = _Backward3_v_PT([50, 23.6, 22.3], [630, 652, 647.7])
+    >>> "%.12f %.12f %.12f" % tuple(v)
+    '0.001470853100 0.002651081407 0.002549486234'
+    """
+    P, T = _asarrays(P, T)
+    code = _Region3_subregion(P, T)
+    v = np.full(P.shape, np.nan)
+    for i in np.unique(code[code >= 0]):
+        idx = code == i
+        v[idx] = _Backward3x_v_PT(T[idx], P[idx], _subregions[i])
+    return v
+
+
+# Region 4
+def _Saturated(P):
+    """Saturated liquid and vapor over an array of P, as the dicts of the
+    basic equations of regions 1 and 2 at the saturation temperature
+
+    >>> liquid, vapor = _Saturated([1])
+    >>> "%.4f %.4f" % (liquid["h"][0], vapor["h"][0])
+    '762.6828 2777.1195'
+    """
+    P = np.asarray(P, dtype=float)
+    T = _TSat_P(P)
+    return _Region1(T, P), _Region2(T, P)
+
+
+def _Region4(P, x, regions=None):
+    """Basic equation for region 4 over arrays of P and x, regions is the
+    dict with the functions of the basic equations, like _Regions, with the
+    saturated states as regions[4]
+
+    >>> p = _Region4([1], [0.5])
+    >>> "%.3f %.4f %.4f" % (p["T"][0], p["h"][0], p["s"][0])
+    '453.036 1769.9012 4.3617'
+    """
+    P, x = _asarrays(P, x)
+    if regions is None:
+        regions = _Regions
+    P1, P2 = regions[4](P)
+    T = P1["T"]
+
+    propiedades = {}
+    propiedades["T"] = T
+    propiedades["P"] = P.copy()
+    propiedades["v"] = P1["v"]+x*(P2["v"]-P1["v"])
+    propiedades["h"] = P1["h"]+x*(P2["h"]-P1["h"])
+    propiedades["s"] = P1["s"]+x*(P2["s"]-P1["s"])
+    for key in ("cp", "cv", "w", "alfav", "kt", "alfap", "betap"):
+        propiedades[key] = np.full(P.shape, np.nan)
+    propiedades["region"] = 4
+    propiedades["x"] = x.copy()
+    return propiedades
+
+
+# Region 5
+def _Region5(T, P):
+    """Basic equation for region 5 over arrays of T and P
+
+    >>> p = _Region5([1500, 1500, 2000], [0.5, 30, 30])
+    >>> "%.8f %.5f" % (p["v"][0], p["h"][0])
+    '1.38455090 5219.76855'
+    >>> "%.8f %.8f %.8f" % (p["s"][1], p["cp"][1], p["cv"][1])
+    '7.72970133 2.72724317 2.19274829'
+    >>> "%.5f" % p["w"][2]
+    '1067.36948'
+    >>> "%.12f %.10f" % (p["alfav"][2], p["kt"][2])
+    '0.000508830641 0.0329193892'
+    """
+    T, P = _asarrays(T, P)
+    Tr = 1000/T
+    Pr = P/1
+
+    go, gop, gopp, got, gott, gopt = Region5_cp0(Tr, Pr)
+
+    gr, grp, grpp, grt, grtt, grpt = _derivatives(_Region5_polynomial, Pr, Tr)
+
+    propiedades = {}
+    propiedades["T"] = T.copy()
+    propiedades["P"] = P.copy()
+    propiedades["v"] = Pr*(gop+grp)*R*T/P/1000
+    propiedades["h"] = Tr*(got+grt)*R*T
+    propiedades["s"] = R*(Tr*(got+grt)-(go+gr))
+    propiedades["cp"] = -R*Tr**2*(gott+grtt)
+    propiedades["cv"] = R*(-Tr**2*(gott+grtt)+(
+        (gop+grp)-Tr*(gopt+grpt))**2/(gopp+grpp))
+    propiedades["w"] = np.sqrt(R*T*1000*(1+2*Pr*grp+Pr**2*grp**2)/(
+        1-Pr**2*grpp+(1+Pr*grp-Tr*Pr*grpt)**2/Tr**2/(gott+grtt)))
+    propiedades["alfav"] = (1+Pr*grp-Tr*Pr*grpt)/(1+Pr*grp)/T
+    propiedades["kt"] = (1-Pr**2*grpp)/(1+Pr*grp)/P
+    propiedades["region"] = 5
+    propiedades["x"] = 1
+    return propiedades
+
+
+def Region5_cp0(Tr, Pr):
+    """Ideal properties for Region 5 over arrays of Tr and Pr"""
+    Tr, Pr = _asarrays(Tr, Pr)
+    go = np.log(Pr)
+    gop = Pr**-1
+    gopp = -Pr**-2
+    got = np.zeros(Tr.shape)
+    gott = np.zeros(Tr.shape)
+    gopt = np.zeros(Tr.shape)
+    for no, Jo in zip(_Region5_cp0_n, _Region5_cp0_J):
+        go += no*Tr**Jo
+        got += no*Jo*Tr**(Jo-1)
+        gott += no*Jo*(Jo-1)*Tr**(Jo-2)
+    return go, gop, gopp, got, gott, gopt
+
+
+def prop0(T, P):
+    """Ideal gas properties over arrays of T and P
+
+    Return a dict with the attributes of the iapws97.prop0 phase, using the
+    region 2 ideal part up to 1073.15 K and the region 5 one above
+
+    >>> p = prop0([50+273.15, 1500], [0.0006112127, 1])
+    >>> "%0.4f %0.4f %0.2f %0.3f %0.2f" % (
+    ...     p["cp"][0], p["cv"][0], p["h"][0], p["s"][0], p["w"][0])
+    '1.8714 1.4098 2594.66 9.471 444.93'
+    >>> "%0.4f %0.2f" % (p["cp"][1], p["h"][1])
+    '2.6142 5220.67'
+    """
+    T, P = _asarrays(T, P)
+    low = T <= 1073.15
+    Tr = np.where(low, 540/T, 1000/T)
+    Pr = P/1.
+    terms = np.empty((6,)+T.shape)
+    terms[:, low] = Region2_cp0(Tr[low], Pr[low])
+    terms[:, ~low] = Region5_cp0(Tr[~low], Pr[~low])
+    go, gop, gopp, got, gott, gopt = terms
+
+    prop0 = {}
+    prop0["v"] = Pr*gop*R*T/P/1000
+    prop0["h"] = Tr*got*R*T
+    prop0["s"] = R*(Tr*got-go)
+    prop0["cp"] = -R*Tr**2*gott
+    prop0["cv"] = R*(-Tr**2*gott+(gop-Tr*gopt)**2/gopp)
+    prop0["w"] = np.sqrt(R*T*1000/(1+1/Tr**2/gott))
+    prop0["alfav"] = 1/T
+    prop0["xkappa"] = 1/P
+    prop0["gamma"] = np.zeros(T.shape)
+    return prop0
+
+
+# Boundaries of the regions along isobars
+def _Boundaries_P(P):
+    """Enthalpy and entropy of the region boundaries along isobars, over an
+    array of P, with the keys of iapws97._Boundaries_P
+
+    The saturation keys (h14, h24) are nan above Ps_623 and the region 3
+    keys (h13, h32) are nan below it, the same for s
+
+    >>> bounds = _Boundaries_P([1, 30])
+    >>> "%.4f %.4f" % (bounds["h14"][0], bounds["h24"][0])
+    '762.6828 2777.1195'
+    >>> "%.4f %.4f" % (bounds["h13"][1], bounds["h32"][1])
+    '1608.7975 2611.8547'
+    """
+    P = np.asarray(P, dtype=float)
+    low = P <= Ps_623
+    high = ~low
+    with np.errstate(all="ignore"):
+        limits = [("min", _Region1(273.15, P)),
+                  ("25", _Region2(1073.15, P)),
+                  ("max", _Region5(2273.15, P))]
+        Tsat = _TSat_P(P[low])
+        limits += [("14", low, _Region1(Tsat, P[low])),
+                   ("24", low, _Region2(Tsat, P[low])),
+                   ("13", high, _Region1(623.15, P[high])),
+                   ("32", high, _Region2(_t_P(P[high]), P[high]))]
+
+    bounds = {}
+    for limit in limits:
+        if len(limit) == 2:
+            key, propiedades = limit
+            for prop in ("h", "s"):
+                bounds[prop+key] = propiedades[prop]
+        else:
+            key, idx, propiedades = limit
+            for prop in ("h", "s"):
+                bounds[prop+key] = np.full(P.shape, np.nan)
+                bounds[prop+key][idx] = propiedades[prop]
+    return bounds
+
+
+def _PSat_h(h):
+    """Define the saturated line, P=f(h) for region 3, over an array of h
+
+    >>> "%.8f %.8f" % tuple(_PSat_h([1700, 2400]))
+    '17.24175718 20.18090839'
+    """
+    nu = np.clip(np.asarray(h, dtype=float), _hmin_Ps3, _hmax_Ps3)/2600
+    suma = 0
+    for n, I, J in zip(_PSat_h_n, _PSat_h_I, _PSat_h_J):
+        suma = suma+n*(nu-1.02)**I*(nu-0.608)**J
+    return 22*suma
+
+
+def _PSat_s(s):
+    """Define the saturated line, P=f(s) for region 3, over an array of s
+
+    >>> "%.8f %.8f" % tuple(_PSat_s([3.8, 5.2]))
+    '16.87755057 16.68968482'
+    """
+    sigma = np.asarray(s, dtype=float)/5.2
+    suma = 0
+    for n, I, J in zip(_PSat_s_n, _PSat_s_I, _PSat_s_J):
+        suma = suma+n*(sigma-1.03)**I*(sigma-0.699)**J
+    return 22*suma
+
+
+def _Bound_P(P, y, prop):
+    """Region definition for input P and h or s, prop, over arrays, with the
+    same conditions than iapws97._Bound_Ph and iapws97._Bound_Ps
+
+    The boundaries are calculated once for each different pressure. Return
+    the int8 array of region codes, 0 for out of bound, and the dict of
+    _Boundaries_P with the boundaries of each point, the saturated liquid
+    and vapor (h14, h24) give the quality of the region 4 points"""
+    P, y = _asarrays(P, y)
+    Pu, inverse = np.unique(P, return_inverse=True)
+    bounds = {}
+    for key, value in _Boundaries_P(Pu).items():
+        bounds[key] = value[inverse.reshape(P.shape)]
+    ymin = bounds[prop+"min"]
+    y25 = bounds[prop+"25"]
+    ymax = bounds[prop+"max"]
+    region = np.zeros(P.shape, dtype=np.int8)
+
+    with np.errstate(invalid="ignore"):
+        low = (Pmin <= P) & (P <= Ps_623)
+        y14 = bounds[prop+"14"]
+        y24 = bounds[prop+"24"]
+        region[low & (ymin <= y) & (y <= y14)] = 1
+        region[low & (y14 < y) & (y < y24)] = 4
+        region[low & (y24 <= y) & (y <= y25)] = 2
+        region[low & (y25 < y) & (y <= ymax)] = 5
+
+        high = (Ps_623 < P) & (P <= 100)
+        y13 = bounds[prop+"13"]
+        y32 = bounds[prop+"32"]
+        region[high & (ymin <= y) & (y <= y13)] = 1
+        region[high & (y13 < y) & (y < y32)] = 3
+        region[high & (y32 <= y) & (y <= y25)] = 2
+        region[high & (y25 < y) & (y <= ymax) & (P <= 50)] = 5
+
+        # Two-phases points near the critical point
+        i = (region == 3) & (P < Pc)
+        if prop == "h":
+            p34 = _PSat_h(y[i])
+        else:
+            p34 = _PSat_s(y[i])
+        region[np.flatnonzero(i)[P[i] < p34]] = 4
+    return region, bounds
+
+
+def _Bound_Ph(P, h):
+    """Region definition for input P and h over arrays, see _Bound_P
+
+    >>> _Bound_Ph([1, 1, 1, 20, 1, 110], [500, 2000, 3000, 2000, 5000, 500])[0]
+    array([1, 4, 2, 4, 5, 0], dtype=int8)
+    """
+    return _Bound_P(P, h, "h")
+
+
+def _Bound_Ps(P, s):
+    """Region definition for input P and s over arrays, see _Bound_P
+
+    >>> _Bound_Ps([1, 1, 1, 25, 1, 110], [1, 5, 7, 4, 10, 1])[0]
+    array([1, 4, 2, 3, 5, 0], dtype=int8)
+    """
+    return _Bound_P(P, s, "s")
+
+
+# Backward equations, the subregions dispatchers of iapws97 over arrays
+def _Backward2_T_Ph(P, h):
+    """Backward equation for region 2, T=f(P,h)
+
+    >>> T = _Backward2_T_Ph([3, 5, 40], [3500, 3500, 2700])
+    >>> "%.6f %.6f %.6f" % tuple(T)
+    '792.259806 801.299102 743.056411'
+    """
+    P, h = _asarrays(P, h)
+    with np.errstate(invalid="ignore"):
+        b = (P <= 6.546699678) | (h >= _hbc_P(P))
+    T = _piecewise((P, h), ((P <= 4, _Backward2a_T_Ph),
+                            (b, _Backward2b_T_Ph),
+                            (~b, _Backward2c_T_Ph)))
+    return np.maximum(_TSat_P(P), T)
+
+
+def _Backward2_T_Ps(P, s):
+    """Backward equation for region 2, T=f(P,s)"""
+    P, s = _asarrays(P, s)
+    T = _piecewise((P, s), ((P <= 4, _Backward2a_T_Ps),
+                            (s >= 5.85, _Backward2b_T_Ps),
+                            (s < 5.85, _Backward2c_T_Ps)))
+    return np.maximum(_TSat_P(P), T)
+
+
+def _h2ab_s(s):
+    """Define the saturated line boundary between Region 4 and 2a-2b,
+    h=f(s)"""
+    sigma1 = s/5.21
+    sigma2 = s/9.2
+    suma = 0
+    for n, I, J in zip(_h2ab_s_n, _h2ab_s_I, _h2ab_s_J):
+        suma = suma+n*(1/sigma1-0.513)**I*(sigma2-0.524)**J
+    return 2800*np.exp(suma)
+
+
+def _hab_s(s):
+    """Define the boundary between Region 2a and 2b, h=f(s)"""
+    h = -0.349898083432139e4 + 0.257560716905876e4*s - \
+        0.421073558227969e3*s**2+0.276349063799944e2*s**3
+    h = np.where(s < _hab_smin, 0, h)
+    return np.where(s > _hab_smax, 5000, h)
+
+
+def _Backward2_P_hs(h, s):
+    """Backward equation for region 2, P=f(h,s)"""
+    h, s = _asarrays(h, s)
+    return _piecewise((h, s), ((h <= _hab_s(s), _Backward2a_P_hs),
+                               (s >= 5.85, _Backward2b_P_hs),
+                               (s < 5.85, _Backward2c_P_hs)))
+
+
+def _Backward3_v_Ph(P, h):
+    """Backward equation for region 3, v=f(P,h)"""
+    P, h = _asarrays(P, h)
+    a = h <= _h_3ab(P)
+    return _piecewise((P, h), ((a, _Backward3a_v_Ph),
+                               (~a, _Backward3b_v_Ph)))
+
+
+def _Backward3_T_Ph(P, h):
+    """Backward equation for region 3, T=f(P,h)"""
+    P, h = _asarrays(P, h)
+    a = h <= _h_3ab(P)
+    return _piecewise((P, h), ((a, _Backward3a_T_Ph),
+                               (~a, _Backward3b_T_Ph)))
+
+
+def _Backward3_v_Ps(P, s):
+    """Backward equation for region 3, v=f(P,s)"""
+    P, s = _asarrays(P, s)
+    return _piecewise((P, s), ((s <= sc, _Backward3a_v_Ps),
+                               (s > sc, _Backward3b_v_Ps)))
+
+
+def _Backward3_T_Ps(P, s):
+    """Backward equation for region 3, T=f(P,s)"""
+    P, s = _asarrays(P, s)
+    return _piecewise((P, s), ((s <= sc, _Backward3a_T_Ps),
+                               (s > sc, _Backward3b_T_Ps)))
+
+
+def _Backward3_P_hs(h, s):
+    """Backward equation for region 3, P=f(h,s)"""
+    h, s = _asarrays(h, s)
+    return _piecewise((h, s), ((s <= sc, _Backward3a_P_hs),
+                               (s > sc, _Backward3b_P_hs)))
+
+
+# Iterative solvers
+def _newton(fun, x, tol=None, maxiter=None):
+    """Solve fun(x, idx)=0 by Newton iterations over arrays of states
+
+    x is a list with the initial values of the one or two unknowns and fun
+    return the residuals and the jacobian for the unconverged points idx.
+    The unknowns must be positive (T, P or rho), a step going below zero is
+    halved instead. Each point leaves the iteration when its relative step
+    is below tol, the points not converged after maxiter are set to nan.
+    tol and maxiter default to the settings of iapws97, read in each call.
+    Return the solution and the number of iterations done by each point"""
+    tol, maxiter = _options(tol, maxiter)
+    x = np.array(x, dtype=float, ndmin=2)
+    idx = np.arange(x.shape[1])
+    niter = np.zeros(x.shape[1], dtype=int)
+    for i in range(maxiter):
+        niter[idx] += 1
+        xo = x[:, idx]
+        with np.errstate(all="ignore"):
+            f, J = fun(xo, idx)
+            if len(x) == 1:
+                dx = f/J[0]
+            else:
+                det = J[0][0]*J[1][1]-J[0][1]*J[1][0]
+                dx = np.array([(f[0]*J[1][1]-f[1]*J[0][1])/det,
+                               (J[0][0]*f[1]-J[1][0]*f[0])/det])
+            xn = xo-dx
+            xn = np.where(xn > 0, xn, xo/2)
+            done = np.all(abs(dx) <= tol*abs(xn), axis=0)
+        x[:, idx] = xn
+        idx = idx[~done]
+        if not idx.size:
+            break
+    else:
+        x[:, idx] = np.nan
+    return x, niter
+
+
+# Basic equations by region, region 3 as function of rho and T and region
+# 4 as the saturated states at P
+_Regions = {1: _Region1, 2: _Region2, 3: _Region3, 4: _Saturated,
+            5: _Region5}
+
+
+def _Solve_T(region, P, y, To, prop, tol=None, maxiter=None):
+    """Temperature for regions 1, 2 or 5 with given P and h or s"""
+    Region = _Regions[region]
+
+    def funcion(x, idx):
+        p = Region(x[0], P[idx])
+        if prop == "h":
+            der = p["cp"]
+        else:
+            der = p["cp"]/x[0]
+        return np.array([p[prop]-y[idx]]), np.array([[der]])
+    x, niter = _newton(funcion, [To], tol, maxiter)
+    return x[0], niter
+
+
+def _Solve_TP(region, h, s, To, Po, tol=None, maxiter=None):
+    """Temperature and pressure for regions 1, 2 or 5 with given h and s"""
+    Region = _Regions[region]
+
+    def funcion(x, idx):
+        T, P = x
+        p = Region(T, P)
+        dhdP = 1000*p["v"]*(1-T*p["alfav"])
+        dsdP = -1000*p["v"]*p["alfav"]
+        f = np.array([p["h"]-h[idx], p["s"]-s[idx]])
+        J = np.array([[p["cp"], dhdP], [p["cp"]/T, dsdP]])
+        return f, J
+    x, niter = _newton(funcion, [To, Po], tol, maxiter)
+    return x[0], x[1], niter
+
+
+def _Solve_rho(T, P, rhoo, tol=None, maxiter=None):
+    """Density in region 3 with given T and P, as iapws97._Solve_rho only
+    the polynomial sum is evaluated in the iterations"""
+    Tr = Tc/T
+
+    def funcion(x, idx):
+        rho = x[0]
+        d = rho/rhoc
+        g, gd, gdd, gt, gtt, gdt = _derivatives(_Region3_polynomial, d,
+                                                Tr[idx])
+        gd += _Region3_n1*d**-1
+        gdd -= _Region3_n1*d**-2
+        Ti = T[idx]
+        return (np.array([d*gd*R*Ti*rho/1000-P[idx]]),
+                np.array([[R*Ti*(2*d*gd+d**2*gdd)/1000]]))
+    x, niter = _newton(funcion, [rhoo], tol, maxiter)
+    return x[0], niter
+
+
+def _Solve_rhoT(a, b, rhoo, To, props, tol=None, maxiter=None):
+    """Density and temperature in region 3 for a pair of properties
+
+    props is the name of the properties given in a and b, as ("P", "h").
+    As iapws97._Solve_rhoT only the polynomial sum is evaluated in the
+    iterations, and the solutions mechanically or thermally unstable,
+    dP/drho<=0 or cv<=0, are set to nan like the not converged ones
+
+    >>> water = IAPWS97Batch(P=[25, 17.5321792], h=[2000, 2224.37745452])
+    >>> water.region
+    array([3, 0], dtype=int8)
+    >>> "%.4f" % water.T[0]
+    '655.3443'
+    """
+    x, y = props
+
+    def sums(rho, T):
+        d = rho/rhoc
+        Tr = Tc/T
+        g, gd, gdd, gt, gtt, gdt = _derivatives(_Region3_polynomial, d, Tr)
+        g += _Region3_n1*np.log(d)
+        gd += _Region3_n1*d**-1
+        gdd -= _Region3_n1*d**-2
+        p = {"d": d, "Tr": Tr, "T": T, "gd": gd, "gdd": gdd, "gtt": gtt,
+             "gdt": gdt}
+        p["P"] = d*gd*R*T*rho/1000
+        p["h"] = R*T*(Tr*gt+d*gd)
+        p["s"] = R*(Tr*gt-g)
+        return p, _Region3_derivatives(p)
+
+    def funcion(par, idx):
+        p, der = sums(par[0], par[1])
+        f = np.array([p[x]-a[idx], p[y]-b[idx]])
+        J = np.array([[der[x, "rho"], der[x, "T"]],
+                      [der[y, "rho"], der[y, "T"]]])
+        return f, J
+    (rho, T), niter = _newton(funcion, [rhoo, To], tol, maxiter)
+    with np.errstate(all="ignore"):
+        p, der = sums(rho, T)
+        unstable = ~((der["P", "rho"] > 0) & (p["gtt"] < 0))
+    rho[unstable] = np.nan
+    T[unstable] = np.nan
+    return rho, T, niter
+
+
+def _flash(thermo, region, a, b, tol=None, maxiter=None):
+    """Solve states of a region with the incoming properties thermo, "TP",
+    "Ph", "Ps" or "hs", and values a, b, by the Newton iterations of the
+    region started from its backward equations
+
+    Return the arrays of T, P and rho, rho only in region 3 and P nan in
+    the region 3 hs states, and the number of iterations of each point
+
+    >>> T, P, rho, niter = _flash("Ph", 1, np.array([3.]), np.array([500.]))
+    >>> "%.4f %.1f %i" % (T[0], P[0], niter[0])
+    '391.7920 3.0 3'
+    """
+    opt = {"tol": tol, "maxiter": maxiter}
+    T = np.full(a.shape, np.nan)
+    P = np.full(a.shape, np.nan)
+    rho = np.full(a.shape, np.nan)
+    niter = np.zeros(a.shape, dtype=int)
+    if thermo == "TP":
+        T[:], P[:] = a, b
+        if region == 3:
+            vo = _Backward3_v_PT(P, T)
+            rho, niter = _Solve_rho(T, P, 1/vo, **opt)
+
+    elif thermo in ("Ph", "Ps"):
+        P[:], y = a, b
+        prop = thermo[1]
+        if prop == "h":
+            Backward = {1: _Backward1_T_Ph, 2: _Backward2_T_Ph,
+                        3: (_Backward3_v_Ph, _Backward3_T_Ph)}
+        else:
+            Backward = {1: _Backward1_T_Ps, 2: _Backward2_T_Ps,
+                        3: (_Backward3_v_Ps, _Backward3_T_Ps)}
+        if region == 3:
+            vo = Backward[3][0](P, y)
+            To = Backward[3][1](P, y)
+            rho, T, niter = _Solve_rhoT(P, y, 1/vo, To, ("P", prop), **opt)
+        else:
+            if region == 5:
+                To = np.full(a.shape, 1500.)
+            else:
+                To = Backward[region](P, y)
+            T, niter = _Solve_T(region, P, y, To, prop, **opt)
+
+    else:
+        h, s = a, b
+        if region == 3:
+            Po = _Backward3_P_hs(h, s)
+            vo = _Backward3_v_Ps(Po, s)
+            To = _Backward3_T_Ps(Po, s)
+            rho, T, niter = _Solve_rhoT(h, s, 1/vo, To, ("h", "s"), **opt)
+        else:
+            if region == 5:
+                To = np.full(a.shape, 1400.)
+                Po = np.ones(a.shape)
+            else:
+                Backward_P = {1: _Backward1_P_hs, 2: _Backward2_P_hs}[region]
+                Backward_T = {1: _Backward1_T_Ph, 2: _Backward2_T_Ph}[region]
+                Po = Backward_P(h, s)
+                To = Backward_T(Po, h)
+            T, P, niter = _Solve_TP(region, h, s, To, Po, **opt)
+    return T, P, rho, niter
+
+
+# Limits of the boundary between Region 2a and 2b, h=f(s)
+_hab_smin = float(_Region2(_TSat_P(4), 4)["s"])
+_hab_smax = float(_Region2(1073.15, 4)["s"])
+
+
+def _Bound_hs(h, s):
+    """Region definition for input h and s over arrays, as an int8 array of
+    region codes, 0 for out of bound, with the same conditions than
+    iapws97._Bound_hs
+
+    Each entropy band is classified with the boundaries and backward
+    equations evaluated only over its points, the points left out of
+    regions 1 to 4 in the range of region 5 are solved with the Newton
+    iterations of region 5 to check its T and P
+
+    >>> _Bound_hs([500, 3000, 2000, 2000, 5000, 9000],
+    ...           [1.5, 7, 5, 4.2, 9, 1])
+    array([1, 2, 4, 3, 5, 0], dtype=int8)
+    """
+    h, s = _asarrays(h, s)
+    region = np.zeros(h.shape, dtype=np.int8)
+    hmax = _hs_hmax
+
+    bands = (
+        (_hs_smin <= s) & (s <= _hs_s13),
+        (_hs_s13 < s) & (s <= _hs_s13s),
+        (_hs_s13s < s) & (s <= sc),
+        (sc < s) & (s < 5.049096828),
+        (5.049096828 <= s) & (s < 5.260578707),
+        (5.260578707 <= s) & (s < 5.85),
+        (5.85 <= s) & (s < _hs_s4v),
+        (_hs_s4v <= s) & (s <= _hs_smax))
+    for band, idx in enumerate(bands):
+        idx &= h <= hmax
+        if not idx.any():
+            continue
+        hi, si = h[idx], s[idx]
+        # Lower limit of region 4, the saturation line at triple point
+        hmin4 = _hs_h4l+(si-_hs_s4l)/(_hs_s4v-_hs_s4l)*(_hs_h4v-_hs_h4l)
+        with np.errstate(all="ignore"):
+            if band == 0:
+                P = _Backward1_P_hs(hi, si)
+                T = _Backward1_T_Ph(P, hi)
+                valid = (T-0.0218 >= 273.15) & (Pt <= P) & (P <= 100)
+                hs = _h1_s(si)
+                cases = ((valid & (hi >= hs), 1),
+                         (valid & (_hs_hmin <= hi) & (hi < hs), 4))
+            elif band == 1:
+                hs = _h1_s(si)
+                h13 = _h13_s(si)
+                cases = (((hi > h13) & (_Backward3_P_hs(hi, si) <= 100), 3),
+                         ((hs <= hi) & (hi <= h13), 1),
+                         ((hmin4 <= hi) & (hi < hs), 4))
+            elif band in (2, 3):
+                if band == 2:
+                    hs = _h3a_s(si)
+                else:
+                    hs = _h2c3b_s(si)
+                cases = (((hi >= hs) & (_Backward3_P_hs(hi, si) <= 100), 3),
+                         ((hmin4 <= hi) & (hi < hs), 4))
+            elif band == 4:
+                hs = _h2c3b_s(si)
+                middle = (_hs_h23min <= hi) & (hi < _hs_h23max)
+                P2c = _Backward2c_P_hs(hi, si)
+                P23 = _P23_T(_t_hs(hi, si))
+                cases = (((_hs_h23max <= hi) &
+                          (_Backward2_P_hs(hi, si) <= 100), 2),
+                         (middle & (P2c <= P23), 2),
+                         (middle, 3),
+                         ((hs <= hi) & (hi < _hs_h23min), 3),
+                         ((hmin4 <= hi) & (hi < hs), 4))
+            elif band == 5:
+                hs = _h2c3b_s(si)
+                cases = (((hs <= hi) & (_Backward2_P_hs(hi, si) <= 100), 2),
+                         ((hmin4 <= hi) & (hi < hs), 4))
+            elif band == 6:
+                hs = _h2ab_s(si)
+                P = _Backward2_P_hs(hi, si)
+                T = _Backward2_T_Ph(P, hi)
+                h2max = _Region2(1073.15, P)["h"]
+                cases = (((P <= 100) & (hs <= hi) & (hi <= h2max) &
+                          (Pmin <= P) & (T <= 1073.15), 2),
+                         ((P <= 100) & (hmin4 <= hi) & (hi < hs), 4))
+            else:
+                P = _Backward2a_P_hs(hi, si)
+                T = _Backward2a_T_Ph(P, hi)
+                cases = (((P >= Pmin) & (T <= 1073.15), 2), )
+
+        codes = np.zeros(hi.shape, dtype=np.int8)
+        for condition, code in reversed(cases):
+            codes[condition] = code
+        region[idx] = codes
+
+    idx = (region == 0) & (_hs_s5min < s) & (s <= _hs_s5max) & \
+        (_hs_h5min < h) & (h <= _hs_h5max)
+    if idx.any():
+        n = idx.sum()
+        T, P, niter = _Solve_TP(5, h[idx], s[idx], np.full(n, 1400.),
+                                np.ones(n))
+        with np.errstate(invalid="ignore"):
+            valid = (1073.15 < T) & (T <= 2273.15) & (Pmin <= P) & (P <= 50)
+        region[np.flatnonzero(idx)[valid]] = 5
+    return region
+
+
+def _solve(thermo, a, b, tol=None, maxiter=None, regions=_Regions):
+    """Solve the states with incoming properties thermo, as "TP" or "Ph",
+    over the flat arrays a and b with the equations of each region
+
+    Return the arrays of region, T, P, rho and x, with the variables of each
+    region used by _state, and the Newton iterations of each point"""
+    T = np.full(a.shape, np.nan)
+    P = np.full(a.shape, np.nan)
+    rho = np.full(a.shape, np.nan)
+    x = np.full(a.shape, np.nan)
+    niter = np.zeros(a.shape, dtype=int)
+
+    if thermo in ("TP", "Ph", "Ps", "hs"):
+        if thermo == "TP":
+            region = _Bound_TP(a, b)
+        elif thermo == "hs":
+            region = _Bound_hs(a, b)
+        else:
+            prop = thermo[1]
+            region, bounds = _Bound_P(a, b, prop)
+            # Two-phases above 623.15 K are solved as region 3, like IAPWS97
+            Tsat = _TSat_P(a)
+            region[(region == 4) & (Tsat > 623.15)] = 3
+
+        for r in (1, 2, 3, 5):
+            i = region == r
+            T[i], P[i], rho[i], niter[i] = _flash(thermo, r, a[i], b[i], tol,
+                                                  maxiter)
+
+        i = region == 4
+        if thermo == "hs":
+            Ts = _Backward4_T_hs(a[i], b[i])
+            P[i] = _PSat_T(Ts)
+            liquid, vapor = regions[4](P[i])
+            x[i] = (a[i]-liquid["h"])/(vapor["h"]-liquid["h"])
+        elif thermo != "TP":
+            P[i] = a[i]
+            if regions is _Regions:
+                # The saturation boundaries are the exact saturated states
+                y1 = bounds[prop+"14"][i]
+                y2 = bounds[prop+"24"][i]
+            else:
+                liquid, vapor = regions[4](P[i])
+                y1, y2 = liquid[prop], vapor[prop]
+            x[i] = (b[i]-y1)/(y2-y1)
+
+    else:
+        if thermo == "Px":
+            P[:], x[:] = a, b
+            T[:] = _TSat_P(P)
+            two = (Pt <= P) & (P <= Pc) & (0 < x) & (x < 1)
+        else:
+            T[:], x[:] = a, b
+            P[:] = _PSat_T(T)
+            two = (Tt <= T) & (T <= Tc) & (0 < x) & (x < 1)
+            sat = (Tt <= T) & (T <= Tc)
+        region = np.zeros(a.shape, dtype=np.int8)
+        region[two] = 4
+        r3 = ~two & (P > Ps_623)
+        region[r3] = 3
+        if thermo == "Px":
+            region[~two & ~r3 & (x == 0)] = 1
+            region[~two & ~r3 & (x == 1)] = 2
+        else:
+            region[~two & ~r3 & sat & (x == 0)] = 1
+            region[~two & ~r3 & sat & (x == 1)] = 2
+        rho[r3] = 1/_Backward3_v_PT(P[r3], T[r3])
+    return region, T, P, rho, x, niter
+
+
+class IAPWS97Batch(object):
+    """Class to model many states of liquid water or steam with IAPWS-IF97
+
+    Incoming properties are arrays, or scalars broadcasted against them, with
+    the same definition options than IAPWS97:
+    T, P    Not valid for two-phases region
+    P, h
+    P, s
+    h, s
+    T, x    Only for two-phases region
+    P, x    Only for two-phases region
+
+    Each point is classified by region and every region subset is solved
+    with the array version of its equation. The results are columnar, one
+    array per property with the shape of the inputs:
+    T, P, x, v, rho, h, u, s, a, g, cp, cv, cp_cv, w, alfav, xkappa
+
+    region is an int8 array with the region of each point, 0 for points out
+    of bound or not converged, whose properties are nan. Two-phases points
+    have no cp, cv, w, alfav or xkappa, also nan. phase is an int8 array
+    with the index of the phase of each point in phases. iterations has the
+    Newton iterations done by each point, 0 for the direct calculations.
+    The solvers tolerance and iteration limit can be set with the tol and
+    maxiter kwargs, by default the module settings iapws97.tol and
+    iapws97.maxiter. The table kwarg takes an iapws97_table.IAPWS97Table to
+    look up the states of the (T, P), (P, h), (P, s) and (h, s) flashes
+    in its tables instead of the Newton iterations, see iapws97_table.
+    With saturation=True the saturated states of two-phases points are
+    interpolated with the splines of iapws97_saturation.
+
+    Usage:
+    >>> water = IAPWS97Batch(T=[300, 700, 1500], P=1)
+    >>> water.region
+    array([1, 2, 5], dtype=int8)
+    >>> "%0.3f %0.3f %0.3f" % tuple(water.h)
+    '113.492 3321.634 5218.863'
+    >>> water = IAPWS97Batch(P=[1, 1, 1, 1], h=[500, 2000, 3000, 5000])
+    >>> water.region
+    array([1, 4, 2, 5], dtype=int8)
+    >>> "%0.4f %0.4f %0.4f %0.4f" % tuple(water.T)
+    '392.1254 453.0356 549.1217 1415.6362'
+    >>> "%0.4f" % water.x[1]
+    '0.6142'
+    >>> water = IAPWS97Batch(P=25, s=[4, 11])
+    >>> water.region
+    array([3, 0], dtype=int8)
+    >>> "%0.3f %0.3f" % (water.T[0], water.rho[0])
+    '646.426 518.914'
+    >>> water = IAPWS97Batch(h=[500, 3000, 2000], s=[1.5, 7, 5])
+    >>> water.region
+    array([1, 2, 4], dtype=int8)
+    >>> "%0.5f %0.5f %0.5f" % tuple(water.P)
+    '6.93394 1.07547 0.61920'
+    >>> water = IAPWS97Batch(P=1, x=[0, 0.5, 1])
+    >>> "%0.2f %0.2f %0.2f" % tuple(water.h)
+    '762.68 1769.90 2777.12'
+    """
+    kwargs = {"T": None,
+              "P": None,
+              "x": None,
+              "h": None,
+              "s": None,
+              "tol": None,
+              "maxiter": None,
+              "table": None,
+              "saturation": False}
+    properties = ("T", "P", "x", "v", "rho", "h", "u", "s", "a", "g", "cp",
+                  "cv", "cp_cv", "w", "alfav", "xkappa")
+    status = 0
+    msg = "Unknown variables"
+
+    def __init__(self, **kwargs):
+        self.kwargs = IAPWS97Batch.kwargs.copy()
+        self.__call__(**kwargs)
+
+    def __call__(self, **kwargs):
+        self.kwargs.update(kwargs)
+
+        if self.calculable:
+            self.status = 1
+            self.calculo()
+            self.msg = "Solved"
+
+    @property
+    def calculable(self):
+        """Check if class is calculable by its kwargs"""
+        self._thermo = ""
+        if self.kwargs["T"] is not None and self.kwargs["P"] is not None:
+            self._thermo = "TP"
+        elif self.kwargs["P"] is not None and self.kwargs["h"] is not None:
+            self._thermo = "Ph"
+        elif self.kwargs["P"] is not None and self.kwargs["s"] is not None:
+            self._thermo = "Ps"
+        elif self.kwargs["h"] is not None and self.kwargs["s"] is not None:
+            self._thermo = "hs"
+        elif self.kwargs["T"] is not None and self.kwargs["x"] is not None:
+            self._thermo = "Tx"
+        elif self.kwargs["P"] is not None and self.kwargs["x"] is not None:
+            self._thermo = "Px"
+        return self._thermo
+
+    def calculo(self):
+        a, b = _asarrays(self.kwargs[self._thermo[0]],
+                         self.kwargs[self._thermo[1]])
+        regions = _Regions
+        if self.kwargs["saturation"]:
+            from iapws97_saturation import _Saturated_spline
+            regions = regions.copy()
+            regions[4] = _Saturated_spline
+        opt = {"tol": self.kwargs["tol"], "maxiter": self.kwargs["maxiter"],
+               "regions": regions}
+        shape = a.shape
+        a = a.ravel()
+        b = b.ravel()
+        table = self.kwargs["table"]
+        if table is None or self._thermo in ("Tx", "Px"):
+            region, T, P, rho, x, niter = _solve(self._thermo, a, b, **opt)
+        else:
+            region, T, P, rho, x = table.flash(self._thermo, a, b, regions)
+            niter = np.zeros(a.shape, dtype=int)
+            # The points out of the tables are solved with the equations
+            rest = region < 0
+            if rest.any():
+                exact = _solve(self._thermo, a[rest], b[rest], **opt)
+                for value, sub in zip((region, T, P, rho, x, niter), exact):
+                    value[rest] = sub
+
+        propiedades = _state(region, T, P, rho, x, regions)
+        bad = np.isnan(propiedades["h"]) | ~_valid(region, propiedades["T"],
+                                                   propiedades["P"])
+        if table is not None and self._thermo not in ("Tx", "Px"):
+            # The looked up states rounded out of the limits of its region
+            # are solved with the equations too
+            redo = np.flatnonzero(bad & ~rest)
+            if redo.size:
+                exact = _solve(self._thermo, a[redo], b[redo], **opt)
+                for value, sub in zip((region, T, P, rho, x, niter), exact):
+                    value[redo] = sub
+                sub = _state(region[redo], T[redo], P[redo], rho[redo],
+                             x[redo], regions)
+                for key in propiedades:
+                    propiedades[key][redo] = sub[key]
+                bad[redo] = np.isnan(sub["h"]) | ~_valid(
+                    region[redo], sub["T"], sub["P"])
+        region[bad] = 0
+        for key in propiedades:
+            propiedades[key][bad] = np.nan
+        self.region = region.reshape(shape)
+        if self._thermo in ("Px", "Tx"):
+            xin = x
+        else:
+            xin = None
+        self.phase = _phase_codes(propiedades["T"], propiedades["P"],
+                                  propiedades["x"], xin).reshape(shape)
+        self.iterations = niter.reshape(shape)
+        for key in ("T", "P", "x", "v", "h", "s", "cp", "cv", "w", "alfav"):
+            setattr(self, key, propiedades[key].reshape(shape))
+        self.xkappa = propiedades["kt"].reshape(shape)
+        self.rho = 1/self.v
+        self.u = self.h-self.P*1000*self.v
+        self.a = self.u-self.T*self.s
+        self.g = self.h-self.T*self.s
+        self.cp_cv = self.cp/self.cv
+
+    def __len__(self):
+        return self.region.size
+
+
+def _valid(region, T, P):
+    """Check the solved states are in the range of validity of its region"""
+    valid = region == 4
+    valid |= (region == 1) & (273.15 <= T) & (T <= 623.15) & (P <= 100)
+    valid |= (region == 2) & (273.15 <= T) & (T <= 1073.15) & (P <= 100)
+    valid |= (region == 3) & (623.15 <= T) & (T <= 863.15) & (
+        Ps_623 <= P) & (P <= 100)
+    valid |= (region == 5) & (1073.15 <= T) & (T <= 2273.15) & (P <= 50)
+    return valid & (P > 0)
+
+
+# Phase names of IAPWS97.getphase, the phase codes are its index
+phases = ("", "Liquid", "Saturated liquid", "Compressible liquid",
+          "Two phases", "Saturated vapor", "Vapor", "Gas",
+          "Supercritical fluid")
+
+
+def _phase_codes(T, P, x, xin=None):
+    """Phase code of states like IAPWS97.getphase, xin is the quality
+    given as input, if any, to detect the saturated states
+
+    >>> [phases[i] for i in _phase_codes(np.array([300, 700, 700, 400]),
+    ...                                  np.array([1, 1, 30, 0.5]),
+    ...                                  np.array([0, 1, 1, 0.5]))]
+    ['Liquid', 'Gas', 'Supercritical fluid', 'Two phases']
+    """
+    code = np.zeros(T.shape, dtype=np.int8)
+    code[x <= 0] = phases.index("Liquid")
+    code[(0 < x) & (x < 1)] = phases.index("Two phases")
+    code[x >= 1] = phases.index("Vapor")
+    if xin is not None:
+        code[(x <= 0) & (xin == 0)] = phases.index("Saturated liquid")
+        code[(x >= 1) & (xin == 1)] = phases.index("Saturated vapor")
+    code[T > Tc] = phases.index("Gas")
+    code[P > Pc] = phases.index("Compressible liquid")
+    code[(P > Pc) & (T > Tc)] = phases.index("Supercritical fluid")
+    code[np.isnan(T) | np.isnan(P)] = 0
+    return code
+
+
+def _state(region, T, P, rho, x, regions=_Regions):
+    """Evaluate the basic equations region by region and merge the results
+
+    T and P are used in regions 1, 2 and 5, rho and T in region 3 and P and x
+    in region 4"""
+    keys = ("T", "P", "x", "v", "h", "s", "cp", "cv", "w", "alfav", "kt")
+    propiedades = {}
+    for key in keys:
+        propiedades[key] = np.full(region.shape, np.nan)
+    for r in (1, 2, 3, 4, 5):
+        i = region == r
+        if not i.any():
+            continue
+        with np.errstate(invalid="ignore"):
+            if r == 3:
+                p = regions[3](rho[i], T[i])
+            elif r == 4:
+                p = _Region4(P[i], x[i], regions)
+            else:
+                p = regions[r](T[i], P[i])
+        for key in keys:
+            propiedades[key][i] = p[key]
+    return propiedades
+
+
+class StateTable(object):
+    """Columnar table of water states
+
+    Each property is kept in a numpy array, with the region and the phase
+    of the states as int8 codes (phase is the index in phases), so many
+    states can be stored without keeping IAPWS97 objects. Properties not
+    available for a state are nan.
+
+    States are added with append, for IAPWS97 objects, or extend, for
+    IAPWS97Batch results, other tables or iterables of IAPWS97. Indexing
+    with a property name return its column, with an integer return a row
+    as a dict and with a slice, index array or mask return a new table.
+
+    >>> table = StateTable(("T", "P", "h"))
+    >>> table.extend(IAPWS97Batch(T=[300, 700, 1500], P=1))
+    >>> table.extend(IAPWS97Batch(P=1, x=[0.5, 1]))
+    >>> len(table)
+    5
+    >>> table.region
+    array([1, 2, 5, 4, 2], dtype=int8)
+    >>> "%0.2f %0.2f" % tuple(table.filter(region=2)["h"])
+    '3321.63 2777.12'
+    >>> "%0.2f" % table.filter(phase="Two phases")[0]["h"]
+    '1769.90'
+    >>> len(table[1:3]), table[-1]["phase"]
+    (2, 'Saturated vapor')
+    """
+    phases = phases
+
+    def __init__(self, properties=IAPWS97Batch.properties):
+        self.properties = tuple(properties)
+        self._size = 0
+        self._columns = {}
+        for key in self.properties:
+            self._columns[key] = np.empty(0)
+        self._region = np.empty(0, dtype=np.int8)
+        self._phase = np.empty(0, dtype=np.int8)
+
+    def __len__(self):
+        return self._size
+
+    def _reserve(self, n):
+        """Grow the arrays to hold at least n states"""
+        capacity = len(self._region)
+        if n <= capacity:
+            return
+        capacity = max(n, 2*capacity, 16)
+        for key in self.properties:
+            column = np.full(capacity, np.nan)
+            column[:self._size] = self._columns[key][:self._size]
+            self._columns[key] = column
+        for name in ("_region", "_phase"):
+            codes = np.zeros(capacity, dtype=np.int8)
+            codes[:self._size] = getattr(self, name)[:self._size]
+            setattr(self, name, codes)
+
+    def append(self, state):
+        """Add a solved IAPWS97 state"""
+        if not state.status:
+            raise ValueError("State not solved")
+        n = self._size
+        self._reserve(n+1)
+        for key in self.properties:
+            value = getattr(state, key, None)
+            if value is None:
+                value = np.nan
+            self._columns[key][n] = value
+        self._region[n] = state.region
+        self._phase[n] = phases.index(state.phase)
+        self._size = n+1
+
+    def extend(self, states):
+        """Add the states of an IAPWS97Batch, a StateTable or an iterable of
+        IAPWS97 states"""
+        if isinstance(states, StateTable):
+            columns = dict((key, states[key]) for key in states.properties)
+            region, phase = states.region, states.phase
+        elif isinstance(states, IAPWS97Batch):
+            columns = {}
+            for key in IAPWS97Batch.properties:
+                columns[key] = getattr(states, key).ravel()
+            region, phase = states.region.ravel(), states.phase.ravel()
+        else:
+            for state in states:
+                self.append(state)
+            return
+
+        n = self._size
+        m = len(region)
+        self._reserve(n+m)
+        for key in self.properties:
+            if key in columns:
+                self._columns[key][n:n+m] = columns[key]
+            else:
+                self._columns[key][n:n+m] = np.nan
+        self._region[n:n+m] = region
+        self._phase[n:n+m] = phase
+        self._size = n+m
+
+    @property
+    def region(self):
+        """Region of each state, 0 if unknown"""
+        return self._region[:self._size]
+
+    @property
+    def phase(self):
+        """Phase code of each state, index in phases"""
+        return self._phase[:self._size]
+
+    def __getitem__(self, index):
+        if isinstance(index, str):
+            return self._columns[index][:self._size]
+        if isinstance(index, (int, np.integer)):
+            if index < 0:
+                index += self._size
+            if not 0 <= index < self._size:
+                raise IndexError("State index out of range")
+            row = {}
+            for key in self.properties:
+                row[key] = self._columns[key][index]
+            row["region"] = int(self._region[index])
+            row["phase"] = phases[self._phase[index]]
+            return row
+
+        table = StateTable(self.properties)
+        region = self.region[index]
+        table._reserve(len(region))
+        for key in self.properties:
+            table._columns[key][:len(region)] = self[key][index]
+        table._region[:len(region)] = region
+        table._phase[:len(region)] = self.phase[index]
+        table._size = len(region)
+        return table
+
+    def filter(self, region=None, phase=None):
+        """New table with the states in the given regions and phases, a
+        region number or phase name or a sequence of them"""
+        mask = np.ones(self._size, dtype=bool)
+        if region is not None:
+            mask &= np.isin(self.region, region)
+        if phase is not None:
+            if isinstance(phase, str):
+                phase = [phase]
+            codes = [phases.index(name) for name in phase]
+            mask &= np.isin(self.phase, codes)
+        return self[mask]
+
+    def columns(self):
+        """Dict with the array of each property, region and phase codes"""
+        columns = dict((key, self[key]) for key in self.properties)
+        columns["region"] = self.region
+        columns["phase"] = self.phase
+        return columns
+
+    def export(self, fname, delimiter=","):
+        """Save the table as text, a header line with the names of the
+        properties and a line for each state, with the region and phase
+        codes in the last columns"""
+        names = self.properties+("region", "phase")
+        data = np.column_stack([self[key] for key in self.properties] +
+                               [self.region, self.phase])
+        fmt = ["%.12g"]*len(self.properties)+["%i", "%i"]
+        np.savetxt(fname, data, fmt=fmt, delimiter=delimiter,
+                   header=delimiter.join(names), comments="")
+
+
+# Columns of the shared memory block of solve_parallel, the incoming
+# properties a and b and the results of IAPWS97Batch
+_parallel_layout = ([("a", float), ("b", float)] +
+                    [(key, float) for key in IAPWS97Batch.properties] +
+                    [("iterations", np.int64), ("region", np.int8),
+                     ("phase", np.int8)])
+
+
+def _parallel_arrays(buf, size):
+    """Views of the columns of _parallel_layout in the buffer buf"""
+    arrays = {}
+    offset = 0
+    for key, dtype in _parallel_layout:
+        arrays[key] = np.ndarray(size, dtype, buf, offset)
+        offset += size*np.dtype(dtype).itemsize
+    return arrays
+
+
+def _parallel_chunk(name, size, thermo, start, stop, kwargs):
+    """Solve the points start:stop of the shared memory block name in a
+    worker process of solve_parallel"""
+    from multiprocessing import shared_memory
+
+    kwargs = kwargs.copy()
+    if isinstance(kwargs.get("table"), str):
+        from iapws97_table import load
+        kwargs["table"] = load(kwargs["table"])
+
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        arrays = _parallel_arrays(block.buf, size)
+        water = IAPWS97Batch(**dict(kwargs, **{
+            thermo[0]: arrays["a"][start:stop].copy(),
+            thermo[1]: arrays["b"][start:stop].copy()}))
+        for key in IAPWS97Batch.properties+("iterations", "region",
+                                            "phase"):
+            arrays[key][start:stop] = getattr(water, key)
+    finally:
+        # The views must be released before closing the block
+        arrays = None
+        block.close()
+
+
+def solve_parallel(workers=None, chunksize=20000, **kwargs):
+    """Solve an IAPWS97Batch in a pool of worker processes
+
+    The points are split in chunks of chunksize solved by a
+    concurrent.futures.ProcessPoolExecutor with workers processes, by
+    default one by CPU. The incoming properties and the results are kept
+    in a shared memory block, so only the chunk limits are sent to the
+    workers. The chunks are assigned on demand, so chunks with costly
+    regions don't delay the others. The points are not grouped by region
+    before chunking: classifying them costs up to half the batch time in
+    the Ph, Ps and hs flashes, and the workers classify each chunk again.
+    The table kwarg can be the name of a file written by
+    iapws97_table.save, loaded in each worker, or an IAPWS97Table, which
+    is saved to a temporary file for the workers. Needs Python 3.8+, see
+    the module docstring
+
+    Return an IAPWS97Batch with the results of all the points
+
+    >>> water = solve_parallel(workers=2, chunksize=2, T=[300, 700, 1500],
+    ...                        P=1)
+    >>> water.region
+    array([1, 2, 5], dtype=int8)
+    >>> "%0.3f %0.3f %0.3f" % tuple(water.h)
+    '113.492 3321.634 5218.863'
+    """
+    import os
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import shared_memory
+
+    water = IAPWS97Batch()
+    water.kwargs.update(kwargs)
+    thermo = water.calculable
+    if not thermo:
+        return water
+    a, b = _asarrays(kwargs[thermo[0]], kwargs[thermo[1]])
+    shape = a.shape
+    size = a.size
+    opt = dict((key, value) for key, value in kwargs.items()
+               if key in ("tol", "maxiter", "table", "saturation"))
+    # The module settings of the workers are the ones at import
+    opt["tol"], opt["maxiter"] = _options(opt.get("tol"), opt.get("maxiter"))
+    filename = None
+    if opt.get("table") is not None and not isinstance(opt["table"], str):
+        # The tables can't be pickled, the workers load them from a file
+        import tempfile
+        from iapws97_table import save
+        fd, filename = tempfile.mkstemp(suffix=".iapws97")
+        os.close(fd)
+        save(opt["table"], filename)
+        opt["table"] = filename
+
+    nbytes = sum(np.dtype(dtype).itemsize for key, dtype in _parallel_layout)
+    block = shared_memory.SharedMemory(create=True, size=max(size*nbytes, 1))
+    arrays = None
+    try:
+        arrays = _parallel_arrays(block.buf, size)
+        arrays["a"][:] = a.ravel()
+        arrays["b"][:] = b.ravel()
+        with ProcessPoolExecutor(workers) as pool:
+            chunks = [pool.submit(_parallel_chunk, block.name, size, thermo,
+                                  start, min(start+chunksize, size), opt)
+                      for start in range(0, size, chunksize)]
+            for chunk in chunks:
+                chunk.result()
+        for key in IAPWS97Batch.properties+("iterations", "region",
+                                            "phase"):
+            setattr(water, key, arrays[key].reshape(shape).copy())
+    finally:
+        arrays = None
+        block.close()
+        block.unlink()
+        if filename is not None:
+            os.remove(filename)
+
+    water.status = 1
+    water.msg = "Solved"
+    return water
+
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
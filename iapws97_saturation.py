@@ -0,0 +1,100 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+"""Saturation line of IAPWS-IF97 over numpy arrays
+
+The saturated liquid and vapor states, v', h', s', v'', h'', s'', are
+interpolated with cubic splines in ln(P) between the triple point and the
+saturation pressure at 623.15 K, the range where they are calculated with
+the basic equations of regions 1 and 2. Out of that range the exact
+equations are used. The saturation temperature and pressure, and the
+boundary of region 3 and 4, P=f(h) and P=f(s), are explicit equations,
+cheaper than any interpolation, so they are evaluated exactly with the
+array functions of iapws97_array.
+"""
+
+from __future__ import division
+
+import numpy as np
+from scipy.interpolate import CubicSpline
+
+from _iapws import Pt
+from iapws97 import Ps_623
+from iapws97_array import _PSat_T, _TSat_P, _Saturated
+
+
+class _SaturationSpline(object):
+    """Cubic splines of v, h and s of the saturated liquid and vapor as
+    function of ln(P), with n nodes between Pmin and Pmax
+
+    Called with an array of P return the saturated liquid and vapor like
+    iapws97_array._Saturated, dicts with T, P, v, h and s. The pressures out
+    of the splines are calculated with _Saturated.
+
+    >>> liquid, vapor = _SaturationSpline()([1, 20])
+    >>> "%.4f %.4f" % (liquid["h"][0], vapor["h"][0])
+    '762.6828 2777.1195'
+    >>> "%.4f %.4f" % (liquid["h"][1], vapor["h"][1])
+    '1821.1043 2421.6805'
+    """
+    keys = ("v", "h", "s")
+
+    def __init__(self, Pmin=Pt, Pmax=Ps_623, n=8000):
+        self.Pmin = Pmin
+        self.Pmax = Pmax
+        lnP = np.linspace(np.log(Pmin), np.log(Pmax), n)
+        liquid, vapor = _Saturated(np.exp(lnP))
+        values = [liquid[key] for key in self.keys]
+        values += [vapor[key] for key in self.keys]
+        self.spline = CubicSpline(lnP, np.array(values), axis=1)
+
+    def __call__(self, P):
+        P = np.asarray(P, dtype=float)
+        T = _TSat_P(P)
+        liquid = {"T": T, "P": P.copy()}
+        vapor = {"T": T.copy(), "P": P.copy()}
+        for key in self.keys:
+            liquid[key] = np.empty(P.shape)
+            vapor[key] = np.empty(P.shape)
+
+        inside = (self.Pmin <= P) & (P <= self.Pmax)
+        values = self.spline(np.log(P[inside]))
+        for i, key in enumerate(self.keys):
+            liquid[key][inside] = values[i]
+            vapor[key][inside] = values[i+len(self.keys)]
+
+        outside = ~inside
+        if outside.any():
+            exact = _Saturated(P[outside])
+            for state, sub in zip((liquid, vapor), exact):
+                for key in self.keys:
+                    state[key][outside] = sub[key]
+        return liquid, vapor
+
+
+# Splines used by IAPWS97Batch with the saturation kwarg
+_Saturated_spline = _SaturationSpline()
+
+
+def saturated_P(P):
+    """Saturated liquid and vapor at the pressures P, as dicts of arrays
+    with T, P, v, h and s
+
+    >>> liquid, vapor = saturated_P(np.array([0.1, 10]))
+    >>> "%.4f %.4f" % tuple(liquid["T"])
+    '372.7559 584.1495'
+    >>> "%.6f %.6f" % tuple(vapor["v"])
+    '1.694023 0.018034'
+    """
+    return _Saturated_spline(P)
+
+
+def saturated_T(T):
+    """Saturated liquid and vapor at the temperatures T, as dicts of arrays
+    with T, P, v, h and s
+
+    >>> liquid, vapor = saturated_T([373.15])
+    >>> "%.5f %.4f %.4f" % (liquid["P"][0], liquid["s"][0], vapor["s"][0])
+    '0.10142 1.3070 7.3541'
+    """
+    return _Saturated_spline(_PSat_T(T))
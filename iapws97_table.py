@@ -0,0 +1,904 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# Tabulated IAPWS-IF97 flashes for fast evaluation of many states
+###############################################################################
+
+"""Look-up tables of the (T, P), (P, h), (P, s) and (h, s) flashes of
+IAPWS97Batch, in the spirit of the IAPWS SBTL method. The variables solved
+by the Newton iterations of each flash, T, P or rho, are tabulated as
+functions of the incoming properties, so the flash is a look up in the
+table followed by the direct evaluation of the basic equation of the
+region, without classifier nor iterations.
+
+Each region is split in domains bounded by two region boundaries, lower
+and upper, along a coordinate X: ln P in the (P, h) and (P, s) flashes, T
+in (T, P) and s in (h, s). The other incoming property y is scaled to
+eta=(y-lower)/(upper-lower), so the domain is the rectangle of X and eta in
+[0, 1], and a point is in the domain if its eta is in that range. The
+boundaries are cubic splines of X, sampled from the region equations, the
+backward equations of the boundaries or the isobars and isotherms limiting
+the region. The logarithms of the variables of the region are interpolated
+in (X, eta) with bicubic Hermite polynomials over a rectilinear grid. The
+two-phases states of region 4 have no table, they are explicit.
+
+The grids are adaptive: starting with 9x9 nodes, the intervals whose
+midpoints of the edges or center of the cells give any property returned
+by the flash, T, P, v, h, s, cp, cv, w, alfav or xkappa, with an error
+bigger than tol/2 against the exact flash are divided, down to 1/1024 of
+the axis, or 1/64 where the exact flash fails. The cells are then checked
+at the quarters of its edges, the ones with an error bigger than tol, or
+with points where the exact flash fails, are left out of the table. The
+error is relative, to a scale for the properties crossing zero, see
+_error. The points in the cells left out are solved with the equations by
+IAPWS97Batch, like the points out of any domain and the looked up states
+rounded out of the limits of its region. Those are the region 3 states
+near the critical point and in the corners where two boundaries meet, the
+(P, h) and (P, s) states of region 3 under the saturation dome and between
+21 MPa and the critical pressure, and the (h, s) states of region 1 with
+entropy below the saturated liquid at the triple point and of regions 2
+and 3 between _hs_h23min and _hs_h23max. The region boundaries of the
+tables are the splines, so the region of the points within about tol of a
+boundary can differ from the one of the exact classifier.
+
+The error of each domain is kept as its tol and the area of the cells left
+out as fallback, validate gives the error of random states. With tol=1e-6
+the tables take about a minute to build and about 60 MB, validate with
+200000 states by region keeps the error below tol, with 92 to 100 % of the
+states looked up, and the flashes of 300000 states are 3 to 5 times faster
+than with the Newton iterations, 2.5 times in the (T, P) states of region
+3, the only ones iterated in that flash.
+
+The tables can be written to a file with save and read back with load,
+which maps the file in memory, so the processes of a job share one copy of
+the tables.
+"""
+
+from __future__ import division
+
+import json
+import math
+
+import numpy as np
+from scipy.interpolate import CubicSpline, PPoly
+
+from _iapws import Tc, Pc
+from iapws97 import Pmin, Ps_623, sc, _t_P, _P23_T, _h1_s, _h13_s, _h3a_s
+from iapws97 import _h2c3b_s, _hmin_Ps3, _hmax_Ps3, _hs_s4l
+from iapws97 import _hs_h4l, _hs_s13, _hs_s13s, _hs_s4v, _hs_h4v, _hs_smax
+from iapws97 import _hs_h23min, _hs_h23max, _Backward4_T_hs
+from iapws97 import _Region3_derivatives
+from iapws97_array import IAPWS97Batch, _PSat_T, _TSat_P, _Bound_TP
+from iapws97_array import _Region1, _Region2, _Region3, _Region5, _h2ab_s
+from iapws97_array import _PSat_h, _PSat_s, _Regions, _flash, _state
+from iapws97_array import _valid
+
+
+class _Spline(object):
+    """Bicubic Hermite splines of several functions tabulated in a
+    rectilinear grid
+
+    zx and zy are the derivatives of the values z at the nodes, by default
+    the second order finite differences of the values, and the cross
+    derivative is the finite difference of them, so a nan value only spoils
+    the cells around it. The splines
+    are stored as the coefficients of the bicubic polynomial of each cell,
+    so the evaluation is a gather and a Horner scheme. Points out of the
+    grid are extrapolated with the polynomial of the nearest cell. The
+    coefficients can be given instead of the values z to skip the fit.
+
+    >>> x = np.linspace(0, 1, 6)
+    >>> z = np.array([np.add.outer(x**2, 3*x**2)])
+    >>> "%.12f" % _Spline(x, x, z)(np.array([0.33]), np.array([0.71]))[0][0]
+    '1.621200000000'
+    """
+    def __init__(self, x, y, z=None, zx=None, zy=None, coef=None):
+        self.x = x
+        self.y = y
+        if coef is not None:
+            self.coef = coef
+            return
+
+        hx = np.diff(x)[:, np.newaxis]
+        hy = np.diff(y)[np.newaxis, :]
+        M = np.array([[1, 0, 0, 0], [0, 0, 1, 0], [-3, 3, -2, -1],
+                      [2, -2, 1, 1]], dtype=float)
+        if zx is None:
+            with np.errstate(invalid="ignore"):
+                zx = np.gradient(z, x, axis=1, edge_order=2)
+                zy = np.gradient(z, y, axis=2, edge_order=2)
+        coef = []
+        for f, fx, fy in zip(z, zx, zy):
+            with np.errstate(invalid="ignore"):
+                fxy = (np.gradient(fx, y, axis=1, edge_order=2) +
+                       np.gradient(fy, x, axis=0, edge_order=2))/2
+
+            # Hermite data of the corners of each cell, in cell units
+            G = np.empty((4, 4)+hx.shape[:1]+hy.shape[1:])
+            for a, b in ((0, 0), (0, 1), (1, 0), (1, 1)):
+                ix = slice(a, len(x)-1+a)
+                iy = slice(b, len(y)-1+b)
+                G[a, b] = f[ix, iy]
+                G[a, 2+b] = fy[ix, iy]*hy
+                G[2+a, b] = fx[ix, iy]*hx
+                G[2+a, 2+b] = fxy[ix, iy]*hx*hy
+            A = np.einsum("ik,kl...,jl->ij...", M, G, M)
+            coef.append(A.reshape(4, 4, -1))
+        self.coef = np.array(coef)
+
+    def __call__(self, x, y):
+        """Interpolated values of the functions at the points x, y"""
+        i = np.clip(np.searchsorted(self.x, x)-1, 0, len(self.x)-2)
+        j = np.clip(np.searchsorted(self.y, y)-1, 0, len(self.y)-2)
+        t = (x-self.x[i])/(self.x[i+1]-self.x[i])
+        u = (y-self.y[j])/(self.y[j+1]-self.y[j])
+        k = i*(len(self.y)-1)+j
+        values = []
+        for coef in self.coef:
+            suma = 0
+            for a in (3, 2, 1, 0):
+                row = coef[a, 3].take(k)
+                for b in (2, 1, 0):
+                    row = row*u+coef[a, b].take(k)
+                suma = suma*t+row
+            values.append(suma)
+        return values
+
+
+# Properties checked in the tables and in validate, the error of the ones
+# crossing zero is relative to the greatest of its value and this scale
+_properties = ("T", "P", "v", "h", "s", "cp", "cv", "w", "alfav", "xkappa")
+_scale = {"h": 1., "s": 1e-2, "alfav": 1e-5}
+
+
+def _error(key, value, exact):
+    """Relative error of the property key, see _scale"""
+    return abs(value-exact)/np.maximum(abs(exact), _scale.get(key, 0))
+
+
+def _coordinates(thermo, a, b):
+    """Coordinates X, y of the tables of the flash thermo for the incoming
+    properties a, b"""
+    if thermo == "TP":
+        return a, b
+    elif thermo == "hs":
+        return b, a
+    with np.errstate(all="ignore"):
+        return np.log(a), b
+
+
+def _inputs(thermo, X, y):
+    """Incoming properties of the flash thermo at the coordinates X, y"""
+    if thermo == "TP":
+        return X, y
+    elif thermo == "hs":
+        return y, X
+    return np.exp(X), y
+
+
+class _Curve(object):
+    """Cubic spline y=f(X) of a region boundary
+
+    funcion returns the X, y of the boundary for an array of its parameter
+    t in tlim, the samples are doubled until the spline at the midpoints of
+    t is within tol of the boundary, with the error of the property key, so
+    the boundary must be monotonic in X. A scipy PPoly already fitted, as
+    read from a file, can be given to skip the sampling.
+
+    >>> curve = _Curve(lambda t: (t, np.exp(t)), (0, 1), 1e-9)
+    >>> "%.9f %i" % (curve(np.array([0.5]))[0], curve.tol < 1e-9)
+    '1.648721271 1'
+    """
+    def __init__(self, funcion=None, tlim=None, tol=None, key="h",
+                 spline=None):
+        if spline is not None:
+            self.spline = spline
+            return
+
+        n = 32
+        while True:
+            t = np.linspace(tlim[0], tlim[1], 2*n+1)
+            with np.errstate(all="ignore"):
+                X, y = funcion(t)
+            order = np.argsort(X[::2])
+            self.spline = CubicSpline(X[::2][order], y[::2][order])
+            self.tol = np.max(_error(key, self.spline(X[1::2]), y[1::2]))
+            if self.tol <= tol or n >= 2**14:
+                break
+            n *= 2
+
+    def __call__(self, X, nu=0):
+        """Value of the boundary at X, or its derivative of order nu"""
+        return self.spline(X, nu)
+
+
+def _interleave(a):
+    """Nodes of the axis a with the midpoints of its intervals"""
+    return np.sort(np.concatenate((a, (a[1:]+a[:-1])/2)))
+
+
+# Variables of the flashes tabulated in each region, the other ones of
+# T, P and rho needed by _state are the incoming properties
+_variables = {("TP", 3): ("rho", ),
+              ("Ph", 1): ("T", ), ("Ph", 2): ("T", ), ("Ph", 5): ("T", ),
+              ("Ph", 3): ("T", "rho"),
+              ("hs", 1): ("T", "P"), ("hs", 2): ("T", "P"),
+              ("hs", 5): ("T", "P"), ("hs", 3): ("T", "rho")}
+for region in (1, 2, 3, 5):
+    _variables["Ps", region] = _variables["Ph", region]
+
+# Variables tabulated without logarithm, the pressure of the liquid is
+# almost linear in eta from the saturation pressure to 100 MPa
+_linear = {("hs", 1): ("P", )}
+
+
+class _Domain(object):
+    """Table of a flash in a region over the domain between the region
+    boundaries lower and upper, see the module docstring
+
+    xlim are the limits of X and curves the dict with the _Curve of the
+    boundaries. The intervals of the grid are divided until the properties
+    at the midpoints of the edges and the center of the cells are within
+    tol/2 of the exact flash. The cells are then checked at the quarters of
+    its edges, the ones above tol are set to nan, tol is then the greatest
+    error of the cells kept and fallback the fraction of the domain area
+    left out. A spline already calculated, as read from a file,
+    can be given with its tol and fallback to skip the building of the grid.
+    The domains of region 4 have no table"""
+
+    def __init__(self, thermo, region, xlim, lower, upper, curves, tol=1e-6,
+                 spline=None, error=(0, 0)):
+        self.thermo = thermo
+        self.region = region
+        self.xlim = xlim
+        self.lower = lower
+        self.upper = upper
+        self.curves = curves
+        self.spline = spline
+        self.tol, self.fallback = error
+        if region == 4:
+            return
+        self.variables = _variables[thermo, region]
+        self.linear = _linear.get((thermo, region), ())
+        if spline is not None:
+            return
+
+        self._cache = None
+        a = np.linspace(xlim[0], xlim[1], 9)
+        b = np.linspace(0, 1, 9)
+        while True:
+            A = _interleave(a)
+            B = _interleave(b)
+            z = self.exact(A, B)
+            n = len(self.variables)
+            self.spline = _Spline(a, b, self.edges(z[:, ::2, ::2], a, b),
+                                  z[n:2*n, ::2, ::2], z[2*n:, ::2, ::2])
+            error = self.error(A, B, z)
+            split_a = self.split(error[1::2], np.diff(a)/(xlim[1]-xlim[0]),
+                                 tol/2)
+            split_b = self.split(error[:, 1::2].T, np.diff(b), tol/2)
+            if not split_a.any() and not split_b.any():
+                break
+            a = np.sort(np.concatenate((a, ((a[1:]+a[:-1])/2)[split_a])))
+            b = np.sort(np.concatenate((b, ((b[1:]+b[:-1])/2)[split_b])))
+
+        # Greatest error of each cell, checked at the quarters of its edges
+        A = _interleave(A)
+        B = _interleave(B)
+        error = self.error(A, B, self.exact(A, B))
+        del self._cache
+        na, nb = len(a)-1, len(b)-1
+        cells = np.zeros((na, nb))
+        for i in range(5):
+            for j in range(5):
+                cells = np.fmax(cells, error[i:i+4*na:4, j:j+4*nb:4])
+        bad = ~(cells <= tol)
+        self.spline.coef[..., bad.ravel()] = np.nan
+        self.tol = float(cells[~bad].max()) if (~bad).any() else 0.
+        area = np.outer(np.diff(a), np.diff(b))
+        self.fallback = float(area[bad].sum()/area.sum())
+
+    @staticmethod
+    def split(error, width, tol):
+        """Intervals of an axis to divide, from the errors at its midpoints
+        by rows and the relative width of the intervals. The intervals are
+        divided down to 1/1024 of the axis, or to 1/64 if the errors above
+        tol are only from states where the flash fails, as in the corners
+        where the two boundaries of the domain meet"""
+        finite = np.where(np.isfinite(error), error, 0).max(1)
+        return (((finite > tol) & (width > 1/1024)) |
+                (~(error <= tol).all(1) & (width > 1/64)))
+
+    def clip(self, X, eta):
+        """Table coordinates with the edges of the domain moved 1e-9 inside
+        it, so the exact flash of a boundary with other phase, as the
+        saturated line in region 3, gives the state of the domain side, and
+        the rounding of the limits doesn't go out of the region"""
+        dx = 1e-9*(self.xlim[1]-self.xlim[0])
+        return (np.clip(X, self.xlim[0]+dx, self.xlim[1]-dx),
+                np.clip(eta, 1e-9, 1-1e-9))
+
+    def inputs(self, X, eta):
+        """Incoming properties of the flash at the table coordinates, see
+        clip"""
+        X, eta = self.clip(X, eta)
+        lower = self.curves[self.lower](X)
+        upper = self.curves[self.upper](X)
+        return _inputs(self.thermo, X, lower+eta*(upper-lower))
+
+    def derivatives(self, X, eta, propiedades):
+        """Derivatives of the logarithms of the tabulated variables respect
+        to X and eta, from the properties of the states at the coordinates
+
+        The variables of the region, u, are T and P, or rho and T in region
+        3, the derivatives of X and y respect to them are inverted and
+        y=lower+eta*(upper-lower) gives the change to eta"""
+        T, P = propiedades["T"], propiedades["P"]
+        with np.errstate(all="ignore"):
+            if self.region == 3:
+                rho = 1/propiedades["v"]
+                der = _Region3_derivatives(_Region3(rho, T))
+                d = {"rho": (1, 0), "T": (0, 1)}
+                for key in ("P", "h", "s"):
+                    d[key] = (der[key, "rho"], der[key, "T"])
+            else:
+                v, cp = propiedades["v"], propiedades["cp"]
+                alfav = propiedades["alfav"]
+                d = {"T": (1, 0), "P": (0, 1),
+                     "h": (cp, 1000*v*(1-T*alfav)),
+                     "s": (cp/T, -1000*v*alfav)}
+            if self.thermo == "TP":
+                dX, dy = d["T"], d["P"]
+            elif self.thermo == "hs":
+                dX, dy = d["s"], d["h"]
+            else:
+                dX = (d["P"][0]/P, d["P"][1]/P)
+                dy = d[self.thermo[1]]
+            det = dX[0]*dy[1]-dX[1]*dy[0]
+
+            lower = self.curves[self.lower]
+            upper = self.curves[self.upper]
+            dyX = lower(X, 1)+eta*(upper(X, 1)-lower(X, 1))
+            dyeta = upper(X)-lower(X)
+            values = {"T": T, "P": P, "rho": 1/propiedades["v"]}
+            dvX, dveta = [], []
+            for name in self.variables:
+                i = d[name].index(1)
+                # Derivatives of u at constant y and at constant X
+                duX = (dy[1], -dy[0])[i]/det
+                duy = (-dX[1], dX[0])[i]/det
+                scale = 1 if name in self.linear else values[name]
+                dvX.append((duX+duy*dyX)/scale)
+                dveta.append(duy*dyeta/scale)
+        return dvX, dveta
+
+    def state(self, a, b, logs):
+        """T, P and rho of the states with incoming properties a, b and the
+        logarithms of the tabulated variables logs"""
+        variables = {"T": np.full(a.shape, np.nan),
+                     "P": np.full(a.shape, np.nan),
+                     "rho": np.full(a.shape, np.nan)}
+        if self.thermo == "TP":
+            variables["T"], variables["P"] = a, b
+        elif self.thermo != "hs":
+            variables["P"] = a
+        for name, value in zip(self.variables, logs):
+            if name in self.linear:
+                variables[name] = value
+            else:
+                variables[name] = np.exp(value)
+        return variables["T"], variables["P"], variables["rho"]
+
+    def properties(self, T, P, rho):
+        """Properties of _state of the region, nan if out of its range"""
+        region = np.full(T.shape, self.region, dtype=np.int8)
+        with np.errstate(all="ignore"):
+            propiedades = _state(region, T, P, rho, np.full(T.shape, np.nan))
+            bad = np.isnan(propiedades["h"]) | ~_valid(
+                region, propiedades["T"], propiedades["P"])
+        propiedades["xkappa"] = propiedades.pop("kt")
+        for key in propiedades:
+            propiedades[key][bad] = np.nan
+        return propiedades
+
+    def exact(self, A, B):
+        """Logarithms of the variables solved by the exact flash at the grid
+        A x B, followed by its derivatives respect to X and eta, nan where
+        it fails, reusing the points of the previous grids"""
+        n = 3*len(self.variables)
+        if self._cache is None:
+            self._cache = (A, B, np.full((n, len(A), len(B)), np.nan),
+                           np.zeros((len(A), len(B)), dtype=bool))
+        a, b, z, known = self._cache
+        Au, Bu = np.union1d(a, A), np.union1d(b, B)
+        zu = np.full((n, len(Au), len(Bu)), np.nan)
+        knownu = np.zeros((len(Au), len(Bu)), dtype=bool)
+        ia, ib = np.ix_(np.searchsorted(Au, a), np.searchsorted(Bu, b))
+        zu[:, ia, ib] = z
+        knownu[ia, ib] = known
+
+        ia, ib = np.ix_(np.searchsorted(Au, A), np.searchsorted(Bu, B))
+        sub = zu[:, ia, ib]
+        need = ~knownu[ia, ib]
+        X, eta = np.meshgrid(A, B, indexing="ij")
+        X, eta = X[need], eta[need]
+        a, b = self.inputs(X, eta)
+        T, P, rho, niter = _flash(self.thermo, self.region, a, b)
+        propiedades = self.properties(T, P, rho)
+        variables = {"T": propiedades["T"], "P": propiedades["P"],
+                     "rho": 1/propiedades["v"]}
+        dvX, dveta = self.derivatives(*self.clip(X, eta), propiedades)
+        values = [variables[name] if name in self.linear else
+                  np.log(variables[name]) for name in self.variables]
+        for i, value in enumerate(values+dvX+dveta):
+            sub[i][need] = value
+        zu[:, ia, ib] = sub
+        knownu[ia, ib] = True
+        self._cache = (Au, Bu, zu, knownu)
+        return sub
+
+    def edges(self, z, A, B):
+        """Values of the variables of z, see exact, at the nodes of the grid
+        A x B, the ones moved by clip are taken back to the edges of the
+        domain with its derivatives"""
+        n = len(self.variables)
+        X, eta = np.meshgrid(A, B, indexing="ij")
+        Xc, etac = self.clip(X, eta)
+        values = z[:n].copy()
+        for value, dX, deta in zip(values, z[n:2*n], z[2*n:]):
+            for moved, step, der in ((X != Xc, X-Xc, dX),
+                                     (eta != etac, eta-etac, deta)):
+                value[moved] += step[moved]*der[moved]
+        return values
+
+    def error(self, A, B, z):
+        """Greatest error of the properties interpolated at the grid A x B
+        against the exact ones, z, inf where any of them is nan"""
+        X, eta = np.meshgrid(A, B, indexing="ij")
+        X, eta = X.ravel(), eta.ravel()
+        a, b = self.inputs(X, eta)
+        logs = z[:len(self.variables)].reshape(len(self.variables), -1)
+        exact = self.properties(*self.state(a, b, logs))
+        logs = self.spline(*self.clip(X, eta))
+        value = self.properties(*self.state(a, b, logs))
+        error = np.where(np.isnan(exact["h"]) | np.isnan(value["h"]),
+                         np.inf, 0)
+        with np.errstate(invalid="ignore"):
+            for key in _properties:
+                error = np.fmax(error, _error(key, value[key], exact[key]))
+        return error.reshape(len(A), len(B))
+
+
+# Limits of the domains of the tables
+_s23a = 5.049096828
+_s23b = 5.260578707
+_s2_863 = float(_Region2(863.15, 100)["s"])
+_s2_1073 = float(_Region2(1073.15, 100)["s"])
+_s5 = [float(s) for s in _Region5(np.array([1073.15, 2273.15, 1073.15,
+                                            2273.15]),
+                                  np.array([50, 50, Pmin, Pmin]))["s"]]
+_P34 = 21.
+
+
+def _root(funcion, a, b):
+    """Root of a monotonic funcion between a and b by bisection"""
+    fa = funcion(a)
+    for i in range(100):
+        m = (a+b)/2
+        if (funcion(m) > 0) == (fa > 0):
+            a = m
+        else:
+            b = m
+    return (a+b)/2
+
+
+# Entropy where the saturated line of region 3 reach _hs_h23min
+_s23min = _root(lambda s: _h2c3b_s(s)-_hs_h23min, _s23a, _s23b)
+
+
+def _dome(funcion, ymin, ymax):
+    """Limits of the parameter of the saturated liquid and vapor branches of
+    the region 3 boundary P=funcion(y), up to a little over _P34"""
+    y = np.linspace(ymin, ymax, 20001)
+    ypeak = y[np.argmax(funcion(y))]
+    liquid = _root(lambda y: funcion(y)-_P34-0.2, ymin, ypeak)
+    vapor = _root(lambda y: funcion(y)-_P34-0.2, ypeak, ymax)
+    return (ymin, liquid), (vapor, ymax)
+
+
+def _curves(thermo):
+    """Boundaries of the domains of the tables of the flash thermo, as a
+    dict with the funcion, the range of the parameter and the property of
+    y, see _Curve"""
+    lnPmin, lnPs, ln100 = math.log(Pmin), math.log(Ps_623), math.log(100)
+    if thermo == "TP":
+        return {
+            "100": (lambda t: (t, np.full(t.shape, 100.)), (623.15, 863.15),
+                    "P"),
+            "sat": (lambda t: (t, _PSat_T(t)), (623.15, Tc), "P"),
+            "23": (lambda t: (t, _P23_T(t)), (623.15, 863.15), "P")}
+
+    elif thermo in ("Ph", "Ps"):
+        prop = thermo[1]
+
+        def isotherm(region, T):
+            return lambda t: (t, region(T, np.exp(t))[prop])
+
+        def saturated(region):
+            return lambda t: (t, region(_TSat_P(np.exp(t)), np.exp(t))[prop])
+
+        if prop == "h":
+            PSat, ymin, ymax = _PSat_h, _hmin_Ps3, _hmax_Ps3
+        else:
+            PSat = _PSat_s
+            ymin = float(_Region1(623.15, Ps_623)["s"])
+            ymax = float(_Region2(623.15, Ps_623)["s"])
+        liquid, vapor = _dome(PSat, ymin, ymax)
+        return {
+            "min": (isotherm(_Region1, 273.15), (lnPmin, ln100), prop),
+            "14": (saturated(_Region1), (lnPmin, lnPs), prop),
+            "24": (saturated(_Region2), (lnPmin, lnPs), prop),
+            "13": (isotherm(_Region1, 623.15), (lnPs, ln100), prop),
+            "32": (lambda t: (t, _Region2(_t_P(np.exp(t)), np.exp(t))[prop]),
+                   (lnPs, ln100), prop),
+            "34l": (lambda t: (np.log(PSat(t)), t), liquid, prop),
+            "34v": (lambda t: (np.log(PSat(t)), t), vapor, prop),
+            "25": (isotherm(_Region2, 1073.15), (lnPmin, ln100), prop),
+            "max": (isotherm(_Region5, 2273.15), (lnPmin, math.log(50)),
+                    prop)}
+
+    def isobar(region, P):
+        def funcion(t):
+            p = region(t, P)
+            return p["s"], p["h"]
+        return funcion
+
+    def isotherm(region, T):
+        def funcion(t):
+            p = region(T, np.exp(t))
+            return p["s"], p["h"]
+        return funcion
+
+    def isobar3(t):
+        T, P, rho, niter = _flash("TP", 3, t, np.full(t.shape, 100.))
+        p = _Region3(rho, t)
+        return p["s"], p["h"]
+
+    def triple(t):
+        return t, _hs_h4l+(t-_hs_s4l)/(_hs_s4v-_hs_s4l)*(_hs_h4v-_hs_h4l)
+
+    ln50 = math.log(50)
+    return {
+        "1_100": (isobar(_Region1, 100), (273.15, 623.15), "h"),
+        "3_100": (isobar3, (623.15, 863.15), "h"),
+        "2_100": (isobar(_Region2, 100), (863.15, 1073.15), "h"),
+        "2_1073": (isotherm(_Region2, 1073.15), (lnPmin, ln100), "h"),
+        "2_Pmin": (isobar(_Region2, Pmin), (273.15, 1073.15), "h"),
+        "1s": (lambda t: (t, _h1_s(t)), (_hs_s4l, _hs_s13s), "h"),
+        "13": (lambda t: (t, _h13_s(t)), (_hs_s13, _hs_s13s), "h"),
+        "3a": (lambda t: (t, _h3a_s(t)), (_hs_s13s, sc), "h"),
+        "2c3b": (lambda t: (t, _h2c3b_s(t)), (sc, 5.85), "h"),
+        "2ab": (lambda t: (t, _h2ab_s(t)), (5.85, _hs_s4v), "h"),
+        "23min": (lambda t: (t, np.full(t.shape, _hs_h23min)),
+                  (_s23a, _s23b), "h"),
+        "23max": (lambda t: (t, np.full(t.shape, _hs_h23max)),
+                  (_s2_863, _s23b), "h"),
+        "4": (triple, (_hs_s4l, _hs_s4v), "h"),
+        "5_1073": (isotherm(_Region5, 1073.15), (lnPmin, ln50), "h"),
+        "5_2273": (isotherm(_Region5, 2273.15), (lnPmin, ln50), "h"),
+        "5_50": (isobar(_Region5, 50), (1073.15, 2273.15), "h"),
+        "5_Pmin": (isobar(_Region5, Pmin), (1073.15, 2273.15), "h")}
+
+
+def _domains(thermo):
+    """Domains of the tables of the flash thermo, as tuples of region,
+    limits of X and the names of the lower and upper boundaries"""
+    if thermo == "TP":
+        return [(3, (623.15, Tc), "sat", "100"),
+                (3, (623.15, Tc), "23", "sat"),
+                (3, (Tc, 863.15), "23", "100")]
+
+    elif thermo in ("Ph", "Ps"):
+        lnPmin, lnPs = math.log(Pmin), math.log(Ps_623)
+        ln100, ln34 = math.log(100), math.log(_P34)
+        return [(1, (lnPmin, lnPs), "min", "14"),
+                (1, (lnPs, ln100), "min", "13"),
+                (2, (lnPmin, lnPs), "24", "25"),
+                (2, (lnPs, ln100), "32", "25"),
+                (3, (lnPs, ln34), "13", "34l"),
+                (3, (lnPs, ln34), "34v", "32"),
+                (3, (math.log(Pc), ln100), "13", "32"),
+                (5, (lnPmin, math.log(50)), "25", "max"),
+                (4, (lnPmin, lnPs), "14", "24")]
+
+    return [(1, (_hs_s4l, _hs_s13), "1s", "1_100"),
+            (1, (_hs_s13, _hs_s13s), "1s", "13"),
+            (2, (_s2_863, _s23b), "23max", "2_100"),
+            (2, (_s23b, 5.85), "2c3b", "2_100"),
+            (2, (5.85, _s2_1073), "2ab", "2_100"),
+            (2, (_s2_1073, _hs_s4v), "2ab", "2_1073"),
+            (2, (_hs_s4v, _hs_smax), "2_Pmin", "2_1073"),
+            (3, (_hs_s13, _hs_s13s), "13", "3_100"),
+            (3, (_hs_s13s, sc), "3a", "3_100"),
+            (3, (sc, _s23a), "2c3b", "3_100"),
+            (3, (_s23a, _s23min), "2c3b", "23min"),
+            (5, (_s5[0], _s5[1]), "5_1073", "5_50"),
+            (5, (_s5[1], _s5[2]), "5_1073", "5_2273"),
+            (5, (_s5[2], _s5[3]), "5_Pmin", "5_2273"),
+            (4, (_hs_s4l, _hs_s13s), "4", "1s"),
+            (4, (_hs_s13s, sc), "4", "3a"),
+            (4, (sc, _s23min), "4", "2c3b"),
+            (4, (_s23min, _s23b), "4", "23min"),
+            (4, (_s23b, 5.85), "4", "2c3b"),
+            (4, (5.85, _hs_s4v), "4", "2ab")]
+
+
+class IAPWS97Table(object):
+    """Tables of the flashes of IAPWS97Batch, see the module docstring
+
+    tol is the tolerance of the properties of the tabulated states and
+    flashes the incoming properties with tables. The tables are built on
+    creation, or read from a file written by save with load, tables is
+    then the dict with the curves and domains of each flash. Calling the
+    table with incoming properties solve the states with IAPWS97Batch, with
+    the same properties. error is the greatest error of the domains and
+    fallback the dict of the fraction of each domain left out of the table
+
+    >>> table = IAPWS97Table(tol=1e-4, flashes=("Ph", ))
+    >>> water = table(P=[1, 20, 1], h=[500, 1800, 3000])
+    >>> water.region
+    array([1, 3, 2], dtype=int8)
+    >>> "%.4f %.4f %.4f" % tuple(water.T)
+    '392.1254 637.5243 549.1217'
+    >>> bool(table.error <= 1e-4)
+    True
+    """
+
+    def __init__(self, tol=1e-6, flashes=("TP", "Ph", "Ps", "hs"),
+                 tables=None):
+        self.tol = tol
+        self.curves = {}
+        self.domains = {}
+        for thermo in flashes:
+            if tables is None:
+                curves = {}
+                for name, (funcion, tlim, key) in _curves(thermo).items():
+                    curves[name] = _Curve(funcion, tlim, 1e-11, key)
+                self.domains[thermo] = [
+                    _Domain(thermo, region, xlim, lower, upper, curves, tol)
+                    for region, xlim, lower, upper in _domains(thermo)]
+            else:
+                splines, domains = tables[thermo]
+                curves = {}
+                for name, spline in splines.items():
+                    curves[name] = _Curve(spline=spline)
+                self.domains[thermo] = [
+                    _Domain(thermo, region, xlim, lower, upper, curves,
+                            spline=spline, error=error)
+                    for (region, xlim, lower, upper), (spline, error) in zip(
+                        _domains(thermo), domains)]
+            self.curves[thermo] = curves
+
+        self.error = max(domain.tol for domains in self.domains.values()
+                         for domain in domains)
+        self.fallback = {}
+        for thermo, domains in self.domains.items():
+            for domain in domains:
+                if domain.region != 4:
+                    key = (thermo, domain.region, domain.lower, domain.upper)
+                    self.fallback[key] = domain.fallback
+
+    def __call__(self, **kwargs):
+        return IAPWS97Batch(table=self, **kwargs)
+
+    def flash(self, thermo, a, b, regions=_Regions):
+        """Look up the states of the flash thermo over the flat arrays of
+        incoming properties a and b. Return the arrays of region, T, P, rho
+        and x like iapws97_array._solve, the region of the points left to
+        the equations is -1, regions is the dict of the basic equations of
+        IAPWS97Batch, for the saturated states of region 4"""
+        region = np.full(a.shape, -1, dtype=np.int8)
+        T = np.full(a.shape, np.nan)
+        P = np.full(a.shape, np.nan)
+        rho = np.full(a.shape, np.nan)
+        x = np.full(a.shape, np.nan)
+        if thermo not in self.domains:
+            return region, T, P, rho, x
+
+        X, y = _coordinates(thermo, a, b)
+        if thermo == "TP":
+            # Only the region 3 is solved by iterations
+            T[:], P[:] = a, b
+            region[:] = _Bound_TP(a, b)
+            region[region == 3] = -1
+        curves = self.curves[thermo]
+        for domain in self.domains[thermo]:
+            with np.errstate(invalid="ignore"):
+                idx = (region == -1) & (domain.xlim[0] <= X) & (
+                    X <= domain.xlim[1])
+            idx = np.flatnonzero(idx)
+            if not idx.size:
+                continue
+            lower = curves[domain.lower](X[idx])
+            upper = curves[domain.upper](X[idx])
+            with np.errstate(all="ignore"):
+                eta = (y[idx]-lower)/(upper-lower)
+                inside = (0 <= eta) & (eta <= 1)
+            idx, eta = idx[inside], eta[inside]
+            ai, bi = a[idx], b[idx]
+
+            if domain.region == 4:
+                region[idx] = 4
+                if thermo == "hs":
+                    P[idx] = _PSat_T(_Backward4_T_hs(ai, bi))
+                    liquid, vapor = regions[4](P[idx])
+                    x[idx] = (ai-liquid["h"])/(vapor["h"]-liquid["h"])
+                else:
+                    P[idx] = ai
+                    if regions is _Regions:
+                        x[idx] = eta
+                    else:
+                        liquid, vapor = regions[4](ai)
+                        prop = thermo[1]
+                        x[idx] = (bi-liquid[prop])/(vapor[prop]-liquid[prop])
+                continue
+
+            logs = domain.spline(X[idx], eta)
+            found = ~np.isnan(logs[0])
+            Ti, Pi, rhoi = domain.state(
+                ai[found], bi[found], [value[found] for value in logs])
+            idx = idx[found]
+            T[idx], P[idx], rho[idx] = Ti, Pi, rhoi
+            region[idx] = domain.region
+        return region, T, P, rho, x
+
+
+# Version of the file format of the tables, increase it with any change
+# of the file layout, the tabulated functions or the meaning of tol
+_FILE_VERSION = 3
+_FILE_MAGIC = "IAPWS97Table"
+
+
+def save(table, filename):
+    """Write the tables of an IAPWS97Table to a binary file
+
+    The file starts with a text line with the format name and version and a
+    json header with the tolerance, the breakpoints and coefficients of the
+    curves and the grid, coefficients, tol and fallback of the domains of
+    each flash, as the offset and shape of each array, padded to 64 bytes.
+    The arrays follow as little endian float64, so the file can be mapped
+    in memory by load"""
+    arrays = []
+    header = {"tol": table.tol, "flashes": {}}
+
+    def add(array):
+        entry = [sum(a.size for a in arrays), list(array.shape)]
+        arrays.append(array)
+        return entry
+
+    for thermo, domains in table.domains.items():
+        curves = {}
+        for name, curve in table.curves[thermo].items():
+            curves[name] = [add(curve.spline.x), add(curve.spline.c)]
+        entries = []
+        for domain in domains:
+            if domain.spline is None:
+                entries.append(None)
+            else:
+                spline = domain.spline
+                entries.append([add(spline.x), add(spline.y),
+                                add(spline.coef), domain.tol,
+                                domain.fallback])
+        header["flashes"][thermo] = [curves, entries]
+
+    text = "%s %i\n%s" % (_FILE_MAGIC, _FILE_VERSION, json.dumps(header))
+    text += " "*(63-len(text) % 64)+"\n"
+    with open(filename, "wb") as f:
+        f.write(text.encode("ascii"))
+        for array in arrays:
+            f.write(np.ascontiguousarray(array, dtype="<f8").tobytes())
+
+
+def load(filename):
+    """Read an IAPWS97Table from a file written by save
+
+    The arrays of the tables are views of a read only numpy.memmap of the
+    file, so the processes loading the same file share the memory pages of
+    the tables and the startup doesn't need to build them
+
+    >>> import os, tempfile
+    >>> filename = os.path.join(tempfile.mkdtemp(), "table.bin")
+    >>> table = IAPWS97Table(tol=1e-4, flashes=("TP", ))
+    >>> save(table, filename)
+    >>> copy = load(filename)
+    >>> water, ref = copy(T=[300, 700], P=30), table(T=[300, 700], P=30)
+    >>> bool((water.h == ref.h).all() and copy.error == table.error)
+    True
+    """
+    with open(filename, "rb") as f:
+        magic = f.readline().decode("ascii").split()
+        if magic[:1] != [_FILE_MAGIC]:
+            raise ValueError("%s isn't an IAPWS97Table file" % filename)
+        if int(magic[1]) != _FILE_VERSION:
+            raise ValueError("Unsupported version %s of the table file %s, "
+                             "expected %i" % (magic[1], filename,
+                                              _FILE_VERSION))
+        header = json.loads(f.readline().decode("ascii"))
+        start = f.tell()
+
+    data = np.memmap(filename, dtype="<f8", mode="r", offset=start)
+
+    def array(entry):
+        offset, shape = entry
+        return data[offset:offset+int(np.prod(shape))].reshape(shape)
+
+    tables = {}
+    for thermo, (curves, entries) in header["flashes"].items():
+        splines = {}
+        for name, (x, c) in curves.items():
+            splines[name] = PPoly.construct_fast(array(c), array(x))
+        domains = []
+        for entry in entries:
+            if entry is None:
+                domains.append((None, (0, 0)))
+            else:
+                x, y, coef, tol, fallback = entry
+                spline = _Spline(array(x), array(y), coef=array(coef))
+                domains.append((spline, (tol, fallback)))
+        tables[thermo] = splines, domains
+    return IAPWS97Table(header["tol"], tuple(tables), tables)
+
+
+def validate(table=None, n=2000, seed=0):
+    """Compare the flashes solved with the tables against the exact ones
+
+    States are sampled at random in regions 1, 2, 3 and 5, and solved with
+    (T, P), (P, h), (P, s) and (h, s) as incoming properties, with the table
+    and with the exact equations. Return a dict by flash and region with
+    the maximum error of the properties, T, P, v, h, s, cp, cv, w, alfav and
+    xkappa, see _error, and the fraction of the states solved without
+    iterations, looked up in the tables or direct in the (T, P) flash
+    """
+    if table is None:
+        table = IAPWS97Table()
+    random = np.random.RandomState(seed)
+    samples = {}
+    T = random.uniform(273.15, 623.15, n)
+    samples[1] = T, random.uniform(_PSat_T(T), 100)
+    T = random.uniform(273.15, 1073.15, n)
+    Pmax = np.where(T < 623.15, _PSat_T(T), _P23_T(T))
+    Pmax[T > 863.15] = 100
+    samples[2] = T, np.exp(random.uniform(np.log(1e-3), np.log(Pmax)))
+    T = random.uniform(623.15, 863.15, n)
+    samples[3] = T, random.uniform(_P23_T(T), 100)
+    T = random.uniform(1073.15, 2273.15, n)
+    samples[5] = T, np.exp(random.uniform(np.log(1e-3), np.log(50), n))
+
+    errors = {}
+    for region, (T, P) in samples.items():
+        exact = IAPWS97Batch(T=T, P=P)
+        valid = (exact.region == region) & _valid(exact.region, T, P)
+        T, P = T[valid], P[valid]
+        h, s = exact.h[valid], exact.s[valid]
+        for thermo, kwargs in (("TP", {"T": T, "P": P}),
+                               ("Ph", {"P": P, "h": h}),
+                               ("Ps", {"P": P, "s": s}),
+                               ("hs", {"h": h, "s": s})):
+            if thermo not in table.domains:
+                continue
+            water, ref = table(**kwargs), IAPWS97Batch(**kwargs)
+            error = np.zeros(T.shape)
+            for key in _properties:
+                e = _error(key, getattr(water, key), getattr(ref, key))
+                error = np.fmax(error, e)
+            errors[thermo, region] = (float(np.nanmax(error)),
+                                      float((water.iterations == 0).mean()))
+    return errors
+
+
+if __name__ == "__main__":
+    table = IAPWS97Table()
+    for key, (error, lookup) in sorted(validate(table).items()):
+        print("%s, region %i: error %.2e, looked up %.1f%%" % (
+            key[0], key[1], error, 100*lookup))